@@ -0,0 +1,83 @@
+"""Throughput of ConcurrentTree and VersionedTree across thread counts.
+
+Each thread runs a fixed mix of lookups and updates for a few seconds; the
+table shows total operations per second. Under CPython's GIL the threads
+do not run tree code in parallel, so this mostly measures what the locking
+costs and how well writers and readers interleave.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_concurrency.py --threads 1,2,4,8
+"""
+import argparse
+import random
+import threading
+import time
+
+from treeconverter.concurrency import ConcurrentTree, VersionedTree
+from treeconverter.persistent import PersistentRedBlackTree
+from treeconverter.rbt import RedBlackTree
+
+def worker(tree, stop, counts, index, write_ratio, key_range):
+    rng = random.Random(index)
+    done = 0
+    while not stop.is_set():
+        for _ in range(100):
+            key = rng.randrange(key_range)
+            r = rng.random()
+            if r < write_ratio / 2:
+                tree.insert(key)
+            elif r < write_ratio:
+                tree.delete(key)
+            else:
+                tree.contains(key)
+        done += 100
+    counts[index] = done
+
+def measure(tree, threads, seconds, write_ratio, key_range):
+    stop = threading.Event()
+    counts = [0] * threads
+    pool = [threading.Thread(target=worker,
+                             args=(tree, stop, counts, i, write_ratio, key_range))
+            for i in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    stop.wait(seconds)
+    stop.set()
+    for t in pool:
+        t.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+def make_tree(name, n):
+    keys = range(0, 2 * n, 2)
+    if name == "ConcurrentTree":
+        rbt = RedBlackTree()
+        rbt.bulk_load(keys)
+        return ConcurrentTree(rbt)
+    return VersionedTree(PersistentRedBlackTree().build(keys))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8",
+                        help="comma-separated thread counts (default: 1,2,4,8)")
+    parser.add_argument("--size", type=int, default=100000,
+                        help="initial tree size (default: 100000)")
+    parser.add_argument("--writes", default="0.01,0.1,0.5",
+                        help="comma-separated update fractions (default: 0.01,0.1,0.5)")
+    parser.add_argument("--seconds", type=float, default=2.0,
+                        help="run time per cell (default: 2)")
+    args = parser.parse_args()
+
+    thread_counts = [int(s) for s in args.threads.split(",")]
+    print(f"{'tree':<16}{'writes':>8}" + "".join(f"{str(t) + ' thr':>12}" for t in thread_counts))
+    for write_ratio in (float(s) for s in args.writes.split(",")):
+        for name in ("ConcurrentTree", "VersionedTree"):
+            rates = []
+            for threads in thread_counts:
+                tree = make_tree(name, args.size)
+                rates.append(measure(tree, threads, args.seconds, write_ratio, 2 * args.size))
+            print(f"{name:<16}{write_ratio:>8.2f}" + "".join(f"{r:>12.0f}" for r in rates))
+
+if __name__ == "__main__":
+    main()
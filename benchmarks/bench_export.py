@@ -0,0 +1,67 @@
+"""SVG and PNG export time, output size and peak memory for large trees.
+
+Each export runs in a fresh process so its peak RSS is its own. Run from
+the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_export.py --sizes 50000,1000000
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from treeconverter.export import export_tree
+from treeconverter.tree import AVLTree, Node
+
+def chain(n):
+    root = node = Node(0)
+    for i in range(1, n):
+        node.right = Node(i)
+        node = node.right
+    return root
+
+def run_one(shape, n, fmt, use_pillow):
+    root = AVLTree().bulk_load(range(n)) if shape == "balanced" else chain(n)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tree." + fmt)
+        start = time.perf_counter()
+        export_tree(root, path, use_pillow=use_pillow)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux
+    print(f"{shape:<10}{n:>10}{fmt:>5}{elapsed:>10.2f}{size / 1e6:>10.1f}"
+          f"{before / 1024:>10.0f}{peak / 1024:>10.0f}", flush=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50000",
+                        help="comma-separated tree sizes (default: 50000)")
+    parser.add_argument("--formats", default="svg,png", help="default: svg,png")
+    parser.add_argument("--no-pillow", action="store_true",
+                        help="time the built-in rasterizer even if Pillow is installed")
+    parser.add_argument("--one", nargs=3, metavar=("SHAPE", "N", "FORMAT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    use_pillow = False if args.no_pillow else None
+
+    if args.one:
+        shape, n, fmt = args.one
+        run_one(shape, int(n), fmt, use_pillow)
+        return
+
+    print(f"{'tree':<10}{'n':>10}{'fmt':>5}{'seconds':>10}{'MB out':>10}"
+          f"{'tree MB':>10}{'peak MB':>10}")
+    for n in args.sizes.split(","):
+        for shape in ("balanced", "chain"):
+            for fmt in args.formats.split(","):
+                command = [sys.executable, __file__, "--one", shape, n, fmt]
+                if args.no_pillow:
+                    command.append("--no-pillow")
+                subprocess.run(command, check=True)
+
+if __name__ == "__main__":
+    main()
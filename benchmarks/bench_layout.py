@@ -0,0 +1,47 @@
+"""tidy_layout time and drawing extent for balanced, random and degenerate trees.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_layout.py --sizes 10000,100000,1000000
+"""
+import argparse
+import random
+import time
+
+from treeconverter.layout import tidy_layout
+from treeconverter.tree import AVLTree, BinarySearchTree, Node
+
+def random_bst(n, seed=0):
+    keys = list(range(n))
+    random.Random(seed).shuffle(keys)
+    bst = BinarySearchTree()
+    root = None
+    for k in keys:
+        root = bst.insert(root, k)
+    return root
+
+def chain(n):
+    root = node = Node(0)
+    for i in range(1, n):
+        node.right = Node(i)
+        node = node.right
+    return root
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000",
+                        help="comma-separated tree sizes (default: 10^4,10^5)")
+    args = parser.parse_args()
+
+    print(f"{'tree':<10}{'n':>10}{'seconds':>10}{'width':>12}{'height':>8}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        for name, root in (("balanced", AVLTree().bulk_load(range(n))),
+                           ("random", random_bst(n)),
+                           ("chain", chain(n))):
+            start = time.perf_counter()
+            layout = tidy_layout(root)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<10}{n:>10}{elapsed:>10.3f}{layout.width:>12.1f}{layout.height:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Level-order conversion: object engine vs. NumPy vectorized engine.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_level_order.py --sizes 1000000,10000000
+"""
+import argparse
+import random
+import time
+from collections import deque
+
+from treeconverter.converter import convert_level_order
+
+def make_tokens(n, null_ratio, seed=0):
+    rng = random.Random(seed)
+    tokens = ["0"]
+    for i in range(1, n):
+        tokens.append("null" if rng.random() < null_ratio else str(i))
+    return tokens
+
+def run(tokens, order, engine):
+    start = time.perf_counter()
+    # Drain without keeping the output around
+    deque(convert_level_order(tokens, order, engine), maxlen=0)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100000,1000000",
+                        help="comma-separated token counts (default: 10^5,10^6)")
+    parser.add_argument("--null-ratio", type=float, default=0.1)
+    parser.add_argument("--order", default="Inorder",
+                        choices=["Inorder", "Preorder", "Postorder"])
+    args = parser.parse_args()
+
+    print(f"{'tokens':>10}{'object s':>12}{'vector s':>12}{'speedup':>10}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        tokens = make_tokens(n, args.null_ratio)
+        obj = run(tokens, args.order, "object")
+        vec = run(tokens, args.order, "vectorized")
+        print(f"{n:>10}{obj:>12.3f}{vec:>12.3f}{obj / vec:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Per-node memory and build/traverse throughput, slotted vs. __dict__ nodes.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_nodes.py --sizes 10000,100000,1000000,10000000
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from treeconverter import traversal
+from treeconverter.converter import TreeNode, construct_tree_level_order
+from treeconverter.rbt import Node as RBNode, RedBlackTree
+from treeconverter.tree import AVLTree, Node
+
+# Subclasses without __slots__ get a per-instance __dict__ again, which is
+# exactly the layout the node classes had before they were slotted.
+class DictTreeNode(TreeNode):
+    pass
+
+class DictNode(Node):
+    pass
+
+class DictRBNode(RBNode):
+    pass
+
+class DictAVLTree(AVLTree):
+    node_class = DictNode
+
+class DictRedBlackTree(RedBlackTree):
+    node_class = DictRBNode
+
+def build_level_order(node_class, n):
+    return construct_tree_level_order((str(i) for i in range(n)), node_class)
+
+def build_avl(tree_class, keys):
+    avl = tree_class()
+    root = None
+    for k in keys:
+        root = avl.insert(root, k)
+    return root
+
+def build_rbt(tree_class, keys):
+    rbt = tree_class()
+    for k in keys:
+        rbt.insert(k)
+    return rbt
+
+def count_linked(root, nil=None):
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is None or node is nil:
+            continue
+        count += 1
+        stack.append(node.left)
+        stack.append(node.right)
+    return count
+
+def measure(build, n):
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    build_time = time.perf_counter() - start
+    del result
+    gc.collect()
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    result = build()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return result, build_time, used / n
+
+def run(n, avl_limit):
+    rows = []
+    keys = list(range(n))
+    random.shuffle(keys)
+    for label, node_class in (("dict", DictTreeNode), ("slots", TreeNode)):
+        root, t, per_node = measure(lambda: build_level_order(node_class, n), n)
+        start = time.perf_counter()
+        for _ in traversal.inorder(root):
+            pass
+        walk = time.perf_counter() - start
+        rows.append(("level-order TreeNode", label, n, per_node, n / t, n / walk))
+        del root
+
+    if n <= avl_limit:
+        for label, tree_class in (("dict", DictAVLTree), ("slots", AVLTree)):
+            root, t, per_node = measure(lambda: build_avl(tree_class, keys), n)
+            start = time.perf_counter()
+            count_linked(root)
+            walk = time.perf_counter() - start
+            rows.append(("AVLTree insert", label, n, per_node, n / t, n / walk))
+            del root
+
+        for label, tree_class in (("dict", DictRedBlackTree), ("slots", RedBlackTree)):
+            rbt, t, per_node = measure(lambda: build_rbt(tree_class, keys), n)
+            start = time.perf_counter()
+            count_linked(rbt.root, rbt.NIL)
+            walk = time.perf_counter() - start
+            rows.append(("RedBlackTree insert", label, n, per_node, n / t, n / walk))
+            del rbt
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000",
+                        help="comma-separated node counts (default: 10^4..10^6)")
+    parser.add_argument("--avl-limit", type=int, default=1000000,
+                        help="skip the per-key AVL/RBT insert runs above this size")
+    args = parser.parse_args()
+
+    print(f"{'workload':<22}{'layout':>7}{'n':>10}{'bytes/node':>12}"
+          f"{'build/s':>12}{'walk/s':>12}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        for name, label, size, per_node, build_rate, walk_rate in run(n, args.avl_limit):
+            print(f"{name:<22}{label:>7}{size:>10}{per_node:>12.1f}"
+                  f"{build_rate:>12.0f}{walk_rate:>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Persistent trees: update throughput and memory kept per snapshot.
+
+Every version produced by a run of random updates is kept alive; the
+memory column is the extra traced memory divided by the number of updates.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_persistent.py --sizes 100000,1000000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from treeconverter.persistent import PersistentAVLTree, PersistentRedBlackTree
+from treeconverter.rbt import RedBlackTree
+
+def run_mutable(n, keys):
+    rbt = RedBlackTree()
+    rbt.bulk_load(range(0, 2 * n, 2))
+    start = time.perf_counter()
+    for k in keys:
+        rbt.insert(k)
+    return len(keys) / (time.perf_counter() - start)
+
+def run_persistent(tree_class, n, keys):
+    base = tree_class().build(range(0, 2 * n, 2))
+    tree = base
+    start = time.perf_counter()
+    for k in keys:
+        tree = tree.insert(k)
+    rate = len(keys) / (time.perf_counter() - start)
+
+    # Second pass under tracemalloc, which would skew the timing above
+    tree, versions = base, []
+    tracemalloc.start()
+    for k in keys:
+        tree = tree.insert(k)
+        versions.append(tree)
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return rate, kept / len(keys)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100000,1000000",
+                        help="comma-separated tree sizes (default: 10^5,10^6)")
+    parser.add_argument("--updates", type=int, default=20000,
+                        help="inserts per run, each kept as a version (default: 20000)")
+    args = parser.parse_args()
+
+    print(f"{'tree':<24}{'n':>10}{'inserts/s':>12}{'bytes/version':>15}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        rng = random.Random(0)
+        # Odd keys, so every insert adds a node
+        keys = [2 * rng.randrange(n) + 1 for _ in range(args.updates)]
+        print(f"{'RedBlackTree (mutable)':<24}{n:>10}{run_mutable(n, keys):>12.0f}{'-':>15}")
+        for tree_class in (PersistentAVLTree, PersistentRedBlackTree):
+            rate, per_version = run_persistent(tree_class, n, keys)
+            print(f"{tree_class.__name__:<24}{n:>10}{rate:>12.0f}{per_version:>15.0f}")
+
+if __name__ == "__main__":
+    main()
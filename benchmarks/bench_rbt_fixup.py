@@ -0,0 +1,203 @@
+"""RedBlackTree insert/delete throughput, dominated by the recoloring fixups.
+
+Each size runs twice: once with the tree's bool ``red`` slot and once with
+a baseline that stores "RED"/"BLACK" strings, the way nodes did before, so
+the two rates can be read side by side.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_rbt_fixup.py --sizes 100000,1000000
+"""
+import argparse
+import random
+import time
+
+from treeconverter.rbt import RedBlackTree
+
+class StrColorNode:
+    __slots__ = ("data", "key", "left", "right", "parent", "color")
+
+    def __init__(self, data, key=None):
+        self.data = data
+        self.key = data if key is None else key
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.color = "RED"
+
+class StrColorRedBlackTree(RedBlackTree):
+    """RedBlackTree with string colors; only the color tests and sets differ."""
+    node_class = StrColorNode
+
+    def __init__(self, key=None):
+        self.key = key
+        self.NIL = self.node_class(None)
+        self.NIL.color = "BLACK"
+        self.root = self.NIL
+
+    def _insert(self, data, key):
+        parent = None
+        current = self.root
+        while current is not self.NIL:
+            parent = current
+            if key < current.key:
+                current = current.left
+            elif key > current.key:
+                current = current.right
+            else:
+                return
+        node = self.node_class(data, key)
+        node.left = self.NIL
+        node.right = self.NIL
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        node.color = "RED"
+        self.insert_fixup(node)
+
+    def insert_fixup(self, node):
+        while node.parent is not None and node.parent.color == "RED":
+            if node.parent is node.parent.parent.left:
+                uncle = node.parent.parent.right
+                if uncle.color == "RED":
+                    node.parent.color = "BLACK"
+                    uncle.color = "BLACK"
+                    node.parent.parent.color = "RED"
+                    node = node.parent.parent
+                else:
+                    if node is node.parent.right:
+                        node = node.parent
+                        self.left_rotate(node)
+                    node.parent.color = "BLACK"
+                    node.parent.parent.color = "RED"
+                    self.right_rotate(node.parent.parent)
+            else:
+                uncle = node.parent.parent.left
+                if uncle.color == "RED":
+                    node.parent.color = "BLACK"
+                    uncle.color = "BLACK"
+                    node.parent.parent.color = "RED"
+                    node = node.parent.parent
+                else:
+                    if node is node.parent.left:
+                        node = node.parent
+                        self.right_rotate(node)
+                    node.parent.color = "BLACK"
+                    node.parent.parent.color = "RED"
+                    self.left_rotate(node.parent.parent)
+        self.root.color = "BLACK"
+
+    def _delete(self, key):
+        node = self.search_node(self.root, key)
+        if node is self.NIL:
+            return False
+        y = node
+        y_original_color = y.color
+        if node.left is self.NIL:
+            x = node.right
+            self.transplant(node, node.right)
+        elif node.right is self.NIL:
+            x = node.left
+            self.transplant(node, node.left)
+        else:
+            y = self.minimum(node.right)
+            y_original_color = y.color
+            x = y.right
+            if y.parent is node:
+                x.parent = y
+            else:
+                self.transplant(y, y.right)
+                y.right = node.right
+                y.right.parent = y
+            self.transplant(node, y)
+            y.left = node.left
+            y.left.parent = y
+            y.color = node.color
+        if y_original_color == "BLACK":
+            self.delete_fixup(x)
+        return True
+
+    def delete_fixup(self, x):
+        while x is not self.root and x.color == "BLACK":
+            if x is x.parent.left:
+                w = x.parent.right
+                if w.color == "RED":
+                    w.color = "BLACK"
+                    x.parent.color = "RED"
+                    self.left_rotate(x.parent)
+                    w = x.parent.right
+                if w.left.color == "BLACK" and w.right.color == "BLACK":
+                    w.color = "RED"
+                    x = x.parent
+                else:
+                    if w.right.color == "BLACK":
+                        w.left.color = "BLACK"
+                        w.color = "RED"
+                        self.right_rotate(w)
+                        w = x.parent.right
+                    w.color = x.parent.color
+                    x.parent.color = "BLACK"
+                    w.right.color = "BLACK"
+                    self.left_rotate(x.parent)
+                    x = self.root
+            else:
+                w = x.parent.left
+                if w.color == "RED":
+                    w.color = "BLACK"
+                    x.parent.color = "RED"
+                    self.right_rotate(x.parent)
+                    w = x.parent.left
+                if w.right.color == "BLACK" and w.left.color == "BLACK":
+                    w.color = "RED"
+                    x = x.parent
+                else:
+                    if w.left.color == "BLACK":
+                        w.right.color = "BLACK"
+                        w.color = "RED"
+                        self.left_rotate(w)
+                        w = x.parent.left
+                    w.color = x.parent.color
+                    x.parent.color = "BLACK"
+                    w.left.color = "BLACK"
+                    self.right_rotate(x.parent)
+                    x = self.root
+        x.color = "BLACK"
+
+def run(tree_class, n, seed=0):
+    keys = list(range(n))
+    random.Random(seed).shuffle(keys)
+    rbt = tree_class()
+
+    start = time.perf_counter()
+    for k in keys:
+        rbt.insert(k)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for k in keys:
+        rbt.delete(k)
+    delete_time = time.perf_counter() - start
+    return n / insert_time, n / delete_time
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000",
+                        help="comma-separated key counts (default: 10^4,10^5)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per size; the best is reported (default: 3)")
+    args = parser.parse_args()
+
+    print(f"{'n':>10}{'colors':>8}{'insert/s':>14}{'delete/s':>14}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        for label, tree_class in (("str", StrColorRedBlackTree), ("bool", RedBlackTree)):
+            results = [run(tree_class, n, seed) for seed in range(args.repeat)]
+            insert_rate = max(r[0] for r in results)
+            delete_rate = max(r[1] for r in results)
+            print(f"{n:>10}{label:>8}{insert_rate:>14.0f}{delete_rate:>14.0f}")
+
+if __name__ == "__main__":
+    main()
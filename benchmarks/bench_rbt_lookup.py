@@ -0,0 +1,49 @@
+"""RedBlackTree lookup throughput: contains/get hits and misses, and deletes.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_rbt_lookup.py --sizes 1000000,10000000
+"""
+import argparse
+import random
+import time
+
+from treeconverter.rbt import RedBlackTree
+
+def rate(fn, queries):
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return len(queries) / (time.perf_counter() - start)
+
+def run(n, queries, seed=0):
+    rng = random.Random(seed)
+    rbt = RedBlackTree()
+    # Even keys only, so odd queries are guaranteed misses
+    rbt.bulk_load(range(0, 2 * n, 2))
+    hits = [2 * rng.randrange(n) for _ in range(queries)]
+    misses = [2 * rng.randrange(n) + 1 for _ in range(queries)]
+    victims = rng.sample(range(0, 2 * n, 2), min(queries, n))
+    return {
+        "contains hit": rate(rbt.contains, hits),
+        "contains miss": rate(rbt.contains, misses),
+        "get hit": rate(rbt.get, hits),
+        "delete": rate(rbt.delete, victims),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100000,1000000",
+                        help="comma-separated tree sizes (default: 10^5,10^6)")
+    parser.add_argument("--queries", type=int, default=200000,
+                        help="lookups per workload (default: 200000)")
+    args = parser.parse_args()
+
+    workloads = ["contains hit", "contains miss", "get hit", "delete"]
+    print(f"{'n':>10}" + "".join(f"{w + '/s':>16}" for w in workloads))
+    for n in (int(s) for s in args.sizes.split(",")):
+        rates = run(n, args.queries)
+        print(f"{n:>10}" + "".join(f"{rates[w]:>16.0f}" for w in workloads))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Stress check for ConcurrentTree and VersionedTree.
+
+Writer threads insert and delete random keys while reader threads check,
+under the read lock (or on a snapshot), that the tree is a valid
+red-black tree whose inorder walk is strictly increasing. Exits with
+status 1 on the first inconsistency.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/stress_concurrency.py --seconds 10
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+
+from treeconverter.concurrency import ConcurrentTree, VersionedTree
+
+def check_rbt(node, nil, lo=None, hi=None):
+    # Returns the black height of node's subtree; raises AssertionError if invalid
+    if node is nil or node is None:
+        return 1
+    assert lo is None or node.key > lo, "keys out of order"
+    assert hi is None or node.key < hi, "keys out of order"
+    if node.red:
+        for child in (node.left, node.right):
+            assert child is nil or child is None or not child.red, "red node with red child"
+    left = check_rbt(node.left, nil, lo, node.key)
+    right = check_rbt(node.right, nil, node.key, hi)
+    assert left == right, "unequal black heights"
+    return left + (0 if node.red else 1)
+
+def check_sorted(values):
+    values = list(values)
+    assert all(a < b for a, b in zip(values, values[1:])), "iteration not increasing"
+
+def locked_reader(tree, stop, failures):
+    while not stop.is_set():
+        try:
+            with tree.read() as rbt:
+                check_rbt(rbt.root, rbt.NIL)
+            check_sorted(tree.irange())
+        except Exception as e:
+            # A crash such as a None dereference on a torn tree counts too
+            failures.append(f"ConcurrentTree: {type(e).__name__}: {e}")
+            stop.set()
+
+def versioned_reader(tree, stop, failures):
+    while not stop.is_set():
+        try:
+            version = tree.snapshot()
+            check_rbt(version.root, None)
+            check_sorted(version)
+            assert len(list(version)) == len(version), "size out of date"
+        except Exception as e:
+            failures.append(f"VersionedTree: {type(e).__name__}: {e}")
+            stop.set()
+
+def writer(tree, stop, seed, key_range):
+    rng = random.Random(seed)
+    while not stop.is_set():
+        key = rng.randrange(key_range)
+        if rng.random() < 0.5:
+            tree.insert(key)
+        else:
+            tree.delete(key)
+
+def run(tree, reader, readers, writers, seconds, key_range):
+    stop = threading.Event()
+    failures = []
+    threads = [threading.Thread(target=reader, args=(tree, stop, failures))
+               for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(tree, stop, i, key_range))
+                for i in range(writers)]
+    for t in threads:
+        t.start()
+    stop.wait(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0,
+                        help="run time per tree (default: 5)")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--keys", type=int, default=2000,
+                        help="size of the key range writers draw from (default: 2000)")
+    args = parser.parse_args()
+
+    # Short switch intervals make threads interleave inside tree operations
+    sys.setswitchinterval(1e-6)
+    failures = []
+    for tree, reader in ((ConcurrentTree(), locked_reader),
+                         (VersionedTree(), versioned_reader)):
+        start = time.perf_counter()
+        found = run(tree, reader, args.readers, args.writers, args.seconds, args.keys)
+        status = "FAILED" if found else "ok"
+        print(f"{type(tree).__name__:<16}{time.perf_counter() - start:>8.1f}s  {status}")
+        failures += found
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
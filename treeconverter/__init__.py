@@ -0,0 +1,24 @@
+from treeconverter.converter import (
+    ENGINES,
+    PAIR_TYPES,
+    TRAVERSAL_TYPES,
+    TreeNode,
+    build_tree_from_in_and_level,
+    build_tree_from_in_and_other,
+    build_tree_from_pre_and_post,
+    build_tree_from_traversals,
+    construct_tree_level_order,
+    convert_level_order,
+    iter_tokens,
+)
+from treeconverter.traversal import inorder, postorder, preorder, traverse
+from treeconverter.tree import (
+    AVLTree,
+    BinarySearchTree,
+    Node,
+    OrderStatisticAVLTree,
+    OrderStatisticBST,
+)
+from treeconverter.rbt import OrderStatisticRedBlackTree, RedBlackTree
+from treeconverter.persistent import PersistentAVLTree, PersistentRedBlackTree
+from treeconverter.store import ArrayTree
@@ -0,0 +1,5 @@
+import sys
+
+from treeconverter.cli import main
+
+sys.exit(main())
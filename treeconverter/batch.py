@@ -0,0 +1,131 @@
+"""Convert many independent trees across a process pool.
+
+Each input line is either a plain space-separated level order, or a JSON
+object with ``level_order`` (string or list) or ``traversals`` (a mapping of
+two traversal names to their values) plus an optional ``order``, e.g.::
+
+    1 2 3 null 5
+    {"level_order": "1 2 3", "order": "Postorder"}
+    {"traversals": {"Inorder": "4 2 5 1 3", "Preorder": "1 2 4 5 3"}}
+
+Results come back as ``(index, result)`` pairs, either in input order or as
+soon as each chunk finishes.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from itertools import islice
+
+from treeconverter.converter import build_tree_from_traversals, convert_level_order
+from treeconverter.traversal import traverse
+
+def _tokens(values):
+    if isinstance(values, str):
+        return values.split()
+    # JSON null marks a missing child, as "null" does in the string form
+    return ['null' if v is None else str(v) for v in values]
+
+def parse_record(line):
+    line = line.strip()
+    if line.startswith("{"):
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            # Reported in order by convert_record, like any other bad record
+            return {"error": f"Invalid JSON: {e}"}
+    return {"level_order": line}
+
+def convert_record(record):
+    order = record.get("order", "Inorder")
+    if "error" in record:
+        return {"order": order, "error": record["error"]}
+    try:
+        if "traversals" in record:
+            (t1, v1), (t2, v2) = record["traversals"].items()
+            tree = build_tree_from_traversals(_tokens(v1), t1, _tokens(v2), t2)
+            values = traverse(tree, order)
+        else:
+            values = convert_level_order(_tokens(record["level_order"]), order)
+        return {"order": order, "result": " ".join(values)}
+    except Exception as e:
+        return {"order": order, "error": str(e)}
+
+def _convert_chunk(chunk):
+    return [(i, convert_record(record)) for i, record in chunk]
+
+def _chunks(records, chunksize):
+    numbered = enumerate(records)
+    while True:
+        chunk = list(islice(numbered, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def convert_batch(records, workers=None, chunksize=64, ordered=True):
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(records, chunksize)
+    if workers == 1:
+        for chunk in chunks:
+            yield from _convert_chunk(chunk)
+        return
+
+    # Imported here so that importing the package stays cheap
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    # Only a few chunks per worker are in flight, so inputs are read lazily
+    # and a slow chunk can't make the output buffer grow without bound.
+    window = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if ordered:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_convert_chunk, chunk))
+                if len(pending) >= window:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            pending = set()
+            for chunk in chunks:
+                pending.add(pool.submit(_convert_chunk, chunk))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m treeconverter.batch",
+        description="Convert JSONL or line-delimited tree records in parallel.",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="records file, or '-' for stdin (default)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 runs inline)")
+    parser.add_argument("-c", "--chunksize", type=int, default=64,
+                        help="records sent to a worker at a time (default: 64)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="write results as they finish instead of in input order")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    stream = sys.stdin if args.input == "-" else open(args.input)
+    try:
+        records = (parse_record(line) for line in stream if line.strip())
+        for index, result in convert_batch(records, args.workers, args.chunksize,
+                                           not args.unordered):
+            sys.stdout.write(json.dumps({"index": index, **result}) + "\n")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
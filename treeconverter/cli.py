@@ -0,0 +1,50 @@
+import argparse
+import sys
+from itertools import islice
+
+from treeconverter.converter import ENGINES, convert_level_order, iter_tokens
+from treeconverter.traversal import TRAVERSALS
+
+ORDERS = {name.lower(): name for name in TRAVERSALS}
+
+def write_stream(values, out, batch_size=4096):
+    first = True
+    while True:
+        batch = list(islice(values, batch_size))
+        if not batch:
+            break
+        if not first:
+            out.write(" ")
+        out.write(" ".join(batch))
+        first = False
+    out.write("\n")
+
+def convert_stream(stream, out, order, engine="object"):
+    write_stream(convert_level_order(iter_tokens(stream), order, engine), out)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="treeconverter",
+        description="Convert a space-separated level order ('null' for None) "
+                    "to inorder, preorder or postorder.",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="level order file, or '-' for stdin (default)")
+    parser.add_argument("-o", "--order", choices=sorted(ORDERS), default="inorder",
+                        help="traversal to write (default: inorder)")
+    parser.add_argument("-e", "--engine", choices=ENGINES, default="object",
+                        help="'object' streams through TreeNode objects; 'vectorized' "
+                             "loads all tokens into NumPy arrays and is faster on bushy "
+                             "trees; deep or skewed input falls back to 'object' "
+                             "(default: object)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    order = ORDERS[args.order]
+    if args.input == "-":
+        convert_stream(sys.stdin, sys.stdout, order, args.engine)
+    else:
+        with open(args.input) as stream:
+            convert_stream(stream, sys.stdout, order, args.engine)
+    return 0
@@ -0,0 +1,180 @@
+"""Sharing one tree between threads.
+
+``ConcurrentTree`` guards a mutable tree (a RedBlackTree by default) with a
+readers-writer lock: any number of lookups run together, updates run alone.
+``VersionedTree`` swaps whole versions of a persistent tree instead, so
+readers never take a lock and always see a complete version.
+"""
+import threading
+from contextlib import contextmanager
+
+from treeconverter.persistent import PersistentRedBlackTree
+from treeconverter.rbt import RedBlackTree
+
+class RWLock:
+    """Many readers or one writer. Not reentrant.
+
+    A waiting writer holds back new readers, so a steady stream of
+    lookups cannot starve updates.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+class ConcurrentTree:
+    """Thread-safe front for a RedBlackTree-style tree.
+
+    Range queries return lists, since a generator would hold the read lock
+    between items. Use ``read()``/``write()`` to run several calls on the
+    underlying tree under one lock.
+    """
+
+    def __init__(self, tree=None):
+        self.tree = tree if tree is not None else RedBlackTree()
+        self.lock = RWLock()
+
+    @contextmanager
+    def read(self):
+        with self.lock.read_locked():
+            yield self.tree
+
+    @contextmanager
+    def write(self):
+        with self.lock.write_locked():
+            yield self.tree
+
+    def contains(self, data):
+        with self.lock.read_locked():
+            return self.tree.contains(data)
+
+    __contains__ = contains
+
+    def get(self, data, default=None):
+        with self.lock.read_locked():
+            return self.tree.get(data, default)
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        with self.lock.read_locked():
+            return list(self.tree.irange(lo, hi, reverse))
+
+    def select(self, k):
+        with self.lock.read_locked():
+            return self.tree.select(k)
+
+    def rank(self, key):
+        with self.lock.read_locked():
+            return self.tree.rank(key)
+
+    def count_range(self, lo, hi):
+        with self.lock.read_locked():
+            return self.tree.count_range(lo, hi)
+
+    def insert(self, data):
+        with self.lock.write_locked():
+            self.tree.insert(data)
+
+    def delete(self, data):
+        with self.lock.write_locked():
+            return self.tree.delete(data)
+
+    def insert_many(self, values):
+        values = list(values)  # consume the input outside the lock
+        with self.lock.write_locked():
+            self.tree.insert_many(values)
+
+    def delete_many(self, values):
+        values = list(values)
+        with self.lock.write_locked():
+            self.tree.delete_many(values)
+
+    def build(self, values):
+        values = list(values)
+        with self.lock.write_locked():
+            self.tree.build(values)
+
+class VersionedTree:
+    """Copy-on-write front for a persistent tree.
+
+    Writers are serialized and publish each new version with one attribute
+    store; readers just take the current version, so lookups and iteration
+    never block and never see a half-applied update.
+    """
+
+    def __init__(self, tree=None):
+        self.current = tree if tree is not None else PersistentRedBlackTree()
+        self._write_lock = threading.Lock()
+
+    def snapshot(self):
+        return self.current
+
+    def __len__(self):
+        return len(self.current)
+
+    def contains(self, data):
+        return self.current.contains(data)
+
+    __contains__ = contains
+
+    def get(self, data, default=None):
+        return self.current.get(data, default)
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        return self.current.irange(lo, hi, reverse)
+
+    def insert(self, data):
+        with self._write_lock:
+            self.current = self.current.insert(data)
+
+    def delete(self, data):
+        with self._write_lock:
+            self.current = self.current.delete(data)
+
+    def update(self, values):
+        # All values become visible together
+        values = list(values)
+        with self._write_lock:
+            self.current = self.current.update(values)
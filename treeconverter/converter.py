@@ -0,0 +1,177 @@
+from collections import deque
+
+from treeconverter.traversal import traverse
+
+TRAVERSAL_TYPES = ["Inorder", "Preorder", "Postorder"]
+PAIR_TYPES = TRAVERSAL_TYPES + ["Level Order"]
+ENGINES = ["object", "vectorized"]
+
+class TreeNode:
+    __slots__ = ("val", "left", "right")
+
+    def __init__(self, val):
+        self.val = val
+        self.left = None
+        self.right = None
+
+def construct_tree_level_order(values, node_class=TreeNode):
+    # values may be any iterable of tokens, so streamed input is consumed
+    # one level at a time instead of being held in a list
+    tokens = iter(values)
+    first = next(tokens, None)
+    if first is None or first.lower() == 'null':
+        return None
+    root = node_class(first)
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        val = next(tokens, None)
+        if val is None:
+            break
+        if val.lower() != 'null':
+            node.left = node_class(val)
+            queue.append(node.left)
+        val = next(tokens, None)
+        if val is None:
+            break
+        if val.lower() != 'null':
+            node.right = node_class(val)
+            queue.append(node.right)
+    return root
+
+def convert_level_order(values, order, engine="object"):
+    if engine == "vectorized":
+        # NumPy is only needed (and imported) for this engine
+        from treeconverter.vectorized import traverse_level_order
+        return traverse_level_order(values, order)
+    if engine != "object":
+        raise ValueError(f"Unknown engine: {engine}")
+    return traverse(construct_tree_level_order(values), order)
+
+def iter_tokens(stream, chunk_size=1 << 16):
+    pending = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        parts = (pending + chunk).split()
+        # The last token may continue in the next chunk
+        if chunk[-1].isspace():
+            pending = ""
+        else:
+            pending = parts.pop() if parts else ""
+        yield from parts
+    if pending:
+        yield pending
+
+def _check_traversals(root, first, second):
+    """Raise ValueError unless root reproduces both (order, values) pairs.
+
+    The builders below only notice some inconsistent pairs while they run,
+    so they finish with this O(n) check.
+    """
+    for order, values in (first, second):
+        if list(traverse(root, order)) != list(values):
+            raise ValueError(f"{first[0]} and {second[0]} do not describe the same tree")
+    return root
+
+def build_tree_from_in_and_other(inorder, other, other_type):
+    if not inorder:
+        return None
+    in_set = set(inorder)
+    n = len(inorder)
+    # Walk Preorder forwards or Postorder backwards; the latter sees each
+    # root before its right subtree, so the two cases mirror each other.
+    if other_type == "Preorder":
+        order, in_order, first, second = other, inorder, "left", "right"
+    else:
+        order, in_order, first, second = reversed(other), reversed(inorder), "right", "left"
+    order = iter(order)
+    in_order = iter(in_order)
+
+    val = next(order)
+    if val not in in_set:
+        raise ValueError(f"{val} is not in the Inorder traversal")
+    root = TreeNode(val)
+    stack = [root]
+    expected = next(in_order)
+    seen = 1
+    for val in order:
+        if val not in in_set:
+            raise ValueError(f"{val} is not in the Inorder traversal")
+        node = TreeNode(val)
+        parent = stack[-1]
+        if parent.val != expected:
+            setattr(parent, first, node)
+        else:
+            # Every stacked node whose inorder slot has come up is finished
+            # on the near side; the new node hangs off the last one popped.
+            while stack and stack[-1].val == expected and seen < n:
+                parent = stack.pop()
+                expected = next(in_order)
+                seen += 1
+            setattr(parent, second, node)
+        stack.append(node)
+    return _check_traversals(root, ("Inorder", inorder), (other_type, other))
+
+def build_tree_from_pre_and_post(preorder, postorder):
+    # Only full binary trees are determined by this pair; a lone child is
+    # always attached on the left.
+    if not preorder:
+        return None
+    root = TreeNode(preorder[0])
+    stack = [root]
+    j = 0
+    for i in range(1, len(preorder)):
+        while stack and stack[-1].val == postorder[j]:
+            stack.pop()
+            j += 1
+        if not stack:
+            raise ValueError("Preorder and Postorder do not describe the same tree")
+        parent = stack[-1]
+        node = TreeNode(preorder[i])
+        if parent.left is None:
+            parent.left = node
+        elif parent.right is None:
+            parent.right = node
+        else:
+            raise ValueError("Preorder and Postorder do not describe the same tree")
+        stack.append(node)
+    return _check_traversals(root, ("Preorder", preorder), ("Postorder", postorder))
+
+def build_tree_from_in_and_level(inorder, level_order):
+    # Parents come before their children in level order, so the tree is the
+    # Cartesian tree of the inorder sequence keyed on level-order position.
+    if not inorder:
+        return None
+    level_index = {val: i for i, val in enumerate(level_order)}
+    stack = []
+    for val in inorder:
+        if val not in level_index:
+            raise ValueError(f"{val} is not in the Level Order traversal")
+        rank = level_index[val]
+        node = TreeNode(val)
+        last = None
+        while stack and level_index[stack[-1].val] > rank:
+            last = stack.pop()
+        node.left = last
+        if stack:
+            stack[-1].right = node
+        stack.append(node)
+    return stack[0]
+
+def build_tree_from_traversals(trav1, t1, trav2, t2):
+    if len(trav1) != len(trav2) or not trav1:
+        raise ValueError("Both traversals must have same length and non-empty")
+    if t1 == t2:
+        raise ValueError("Select two different traversals!")
+
+    pair = {t1: trav1, t2: trav2}
+    if "Inorder" in pair:
+        if "Level Order" in pair:
+            return build_tree_from_in_and_level(pair["Inorder"], pair["Level Order"])
+        other_type = t2 if t1 == "Inorder" else t1
+        return build_tree_from_in_and_other(pair["Inorder"], pair[other_type], other_type)
+    if "Preorder" in pair and "Postorder" in pair:
+        return build_tree_from_pre_and_post(pair["Preorder"], pair["Postorder"])
+    raise ValueError(f"Cannot build a tree from {t1} + {t2}!")
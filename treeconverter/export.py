@@ -0,0 +1,454 @@
+"""Headless export of trees to SVG and PNG.
+
+Trees are placed with the same tidy_layout and NodeStyle as the Tk apps,
+so an export looks like the canvas, but no display is needed. Nothing is
+built up in memory: SVG elements are written as they are produced, and PNG
+images are rasterized one strip of rows at a time and streamed through
+zlib. Beyond the layout itself, memory stays at one strip whatever the
+size of the image.
+
+Pillow draws the strips when it is installed. Otherwise a small
+pure-Python rasterizer fills pixel spans and draws labels with a built-in
+3x5 font (digits, letters, '-' and '.').
+
+Run from the repository root::
+
+    python -m treeconverter.export level_order.txt -o tree.svg
+    python -m treeconverter.export level_order.txt -o tree.png --max-width 4096
+"""
+import argparse
+import math
+import struct
+import sys
+import zlib
+from xml.sax.saxutils import escape
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+from treeconverter.converter import construct_tree_level_order, iter_tokens
+from treeconverter.gui.renderer import NodeStyle
+from treeconverter.layout import tidy_layout
+
+# Same cut-off as the canvas: smaller nodes are drawn without labels
+MIN_LABEL_RADIUS = 9
+
+class Geometry:
+    """Pixel positions for a layout, with the style's steps scaled per axis."""
+
+    def __init__(self, layout, style, x_scale=1.0, y_scale=1.0):
+        self.layout = layout
+        self.style = style
+        self.unit = style.x_step * x_scale
+        self.level = style.y_step * y_scale
+        self.scale = min(x_scale, y_scale)
+        self.radius = style.radius * self.scale
+        self.margin = style.margin
+        self.width = math.ceil(2 * self.margin + layout.width * self.unit) + 1
+        self.height = math.ceil(2 * self.margin + max(0, layout.height - 1) * self.level) + 1
+
+    @classmethod
+    def fit(cls, layout, style, max_width=None, max_height=None):
+        """Shrink each axis (never enlarge) so the image fits in max_width x max_height."""
+        x_scale = y_scale = 1.0
+        room = 2 * style.margin + 1
+        if max_width and layout.width:
+            x_scale = min(1.0, (max_width - room) / (layout.width * style.x_step))
+        if max_height and layout.height > 1:
+            y_scale = min(1.0, (max_height - room) / ((layout.height - 1) * style.y_step))
+        return cls(layout, style, max(x_scale, 1e-9), max(y_scale, 1e-9))
+
+    def node_x(self, i):
+        return self.margin + self.layout.x[i] * self.unit
+
+    def level_y(self, d):
+        return self.margin + d * self.level
+
+    def line_width(self, width):
+        return max(1, round(width * self.scale))
+
+    def font_size(self):
+        return max(6, round(self.style.font_size * self.scale))
+
+# SVG
+
+def _f(v):
+    return f"{v:.1f}"
+
+def write_svg(out, geometry, background="white"):
+    """Write the laid-out tree to text stream out as SVG, element by element."""
+    layout, style, g = geometry.layout, geometry.style, geometry
+    r = g.radius
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{g.width}" height="{g.height}" '
+              f'viewBox="0 0 {g.width} {g.height}">\n')
+    out.write(f'<rect width="100%" height="100%" fill="{background}"/>\n')
+
+    out.write(f'<g stroke="{style.edge_fill}" stroke-width="{g.line_width(style.edge_width)}">\n')
+    for d in range(1, layout.height):
+        y, py = _f(g.level_y(d) - r), _f(g.level_y(d - 1) + r)
+        for i in range(layout.level_starts[d], layout.level_starts[d + 1]):
+            out.write(f'<line x1="{_f(g.node_x(layout.parent[i]))}" y1="{py}" '
+                      f'x2="{_f(g.node_x(i))}" y2="{y}"/>\n')
+    out.write('</g>\n')
+
+    labels = r >= MIN_LABEL_RADIUS
+    out.write(f'<g stroke-width="{g.line_width(style.outline_width)}" '
+              f'font-family="{style.font_family}" font-size="{g.font_size()}" '
+              'font-weight="bold" text-anchor="middle" dominant-baseline="central">\n')
+    for d in range(layout.height):
+        y = _f(g.level_y(d))
+        for i in range(layout.level_starts[d], layout.level_starts[d + 1]):
+            node = layout.nodes[i]
+            x = _f(g.node_x(i))
+            fill, outline = style.colors(node)
+            out.write(f'<circle cx="{x}" cy="{y}" r="{_f(r)}" fill="{fill}" stroke="{outline}"/>\n')
+            if labels:
+                out.write(f'<text x="{x}" y="{y}" fill="{style.text_fill}">'
+                          f'{escape(style.label(node))}</text>\n')
+    out.write('</g>\n</svg>\n')
+
+# PNG
+
+def _chunk(kind, data):
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+class PNGWriter:
+    """Streams an 8-bit RGB image to a binary file, one row at a time."""
+    chunk_bytes = 1 << 16
+
+    def __init__(self, out, width, height, level=6):
+        self.out = out
+        out.write(b"\x89PNG\r\n\x1a\n")
+        out.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        self._zlib = zlib.compressobj(level)
+        self._buffer = []
+        self._buffered = 0
+
+    def write_row(self, row):
+        self._emit(self._zlib.compress(b"\x00"))  # filter type 0: none
+        self._emit(self._zlib.compress(row))
+
+    def _emit(self, data, force=False):
+        if data:
+            self._buffer.append(data)
+            self._buffered += len(data)
+        if self._buffered >= self.chunk_bytes or (force and self._buffered):
+            self.out.write(_chunk(b"IDAT", b"".join(self._buffer)))
+            self._buffer, self._buffered = [], 0
+
+    def close(self):
+        self._emit(self._zlib.flush(), force=True)
+        self.out.write(_chunk(b"IEND", b""))
+
+_NAMED_COLORS = {
+    "white": (255, 255, 255), "black": (0, 0, 0), "red": (255, 0, 0),
+    "green": (0, 128, 0), "blue": (0, 0, 255), "gray": (128, 128, 128),
+    "grey": (128, 128, 128),
+}
+
+def parse_color(spec):
+    """Return the RGB bytes of a '#rgb', '#rrggbb' or basic named color."""
+    spec = spec.strip().lower()
+    if spec in _NAMED_COLORS:
+        return bytes(_NAMED_COLORS[spec])
+    if spec.startswith("#") and len(spec) in (4, 7):
+        digits = spec[1:]
+        if len(digits) == 3:
+            digits = "".join(c * 2 for c in digits)
+        return bytes.fromhex(digits)
+    raise ValueError(f"Unsupported color: {spec}")
+
+# 3x5 glyphs, rows top to bottom
+_GLYPHS = {
+    "0": "111101101101111", "1": "010110010010111", "2": "111001111100111",
+    "3": "111001111001111", "4": "101101111001001", "5": "111100111001111",
+    "6": "111100111101111", "7": "111001001001001", "8": "111101111101111",
+    "9": "111101111001111", "-": "000000111000000", ".": "000000000000010",
+    "A": "010101111101101", "B": "110101110101110", "C": "011100100100011",
+    "D": "110101101101110", "E": "111100110100111", "F": "111100110100100",
+    "G": "011100101101011", "H": "101101111101101", "I": "111010010010111",
+    "J": "001001001101010", "K": "101101110101101", "L": "100100100100111",
+    "M": "101111111101101", "N": "110101101101101", "O": "010101101101010",
+    "P": "110101110100100", "Q": "010101101110011", "R": "110101110101101",
+    "S": "011100010001110", "T": "111010010010010", "U": "101101101101111",
+    "V": "101101101101010", "W": "101101111111101", "X": "101101010101101",
+    "Y": "101101010010010", "Z": "111001010100111",
+}
+
+class Strip:
+    """Rows y0..y1 - 1 of an RGB image, drawn by filling horizontal spans."""
+
+    def __init__(self, width, y0, y1, background):
+        self.width = width
+        self.y0 = y0
+        self.y1 = y1
+        self.buffer = bytearray(background * (width * (y1 - y0)))
+
+    color = staticmethod(parse_color)
+
+    def rows(self):
+        stride = 3 * self.width
+        view = memoryview(self.buffer)
+        for i in range(self.y1 - self.y0):
+            yield view[i * stride:(i + 1) * stride]
+
+    def span(self, y, x0, x1, color):
+        # Columns round(x0) .. round(x1) - 1 of row y, at least one
+        if y < self.y0 or y >= self.y1:
+            return
+        a = math.floor(x0 + 0.5)
+        b = max(a + 1, math.floor(x1 + 0.5))
+        a, b = max(a, 0), min(b, self.width)
+        if a < b:
+            at = 3 * ((y - self.y0) * self.width + a)
+            self.buffer[at:at + 3 * (b - a)] = color * (b - a)
+
+    def dot(self, x, y, color):
+        self.span(math.floor(y), x, x, color)
+
+    def lines(self, segments, y0, y1, color, width):
+        # All of one level's edges, running down from row y0 to row y1, as
+        # (top x, bottom x) pairs ordered left to right. Each row's spans are
+        # ordered too, so overlapping ones are merged before they are filled.
+        half = width / 2
+        if y1 - y0 < 1:
+            y1 = y0 + 1
+        first = max(math.floor(y0), self.y0)
+        last = min(math.ceil(y1), self.y1)
+        height = y1 - y0
+        for y in range(first, last):
+            t0 = (max(y, y0) - y0) / height
+            t1 = (min(y + 1, y1) - y0) / height
+            lo = hi = None
+            for x0, x1 in segments:
+                a = x0 + (x1 - x0) * t0
+                b = x0 + (x1 - x0) * t1
+                if a > b:
+                    a, b = b, a
+                if hi is not None and a - half <= hi:
+                    if b + half > hi:
+                        hi = b + half
+                    continue
+                if hi is not None:
+                    self.span(y, lo, hi, color)
+                lo, hi = a - half, b + half
+            if hi is not None:
+                self.span(y, lo, hi, color)
+
+    def circle(self, cx, cy, r, fill, outline, width):
+        inner = r - width
+        first = max(math.floor(cy - r), self.y0)
+        last = min(math.ceil(cy + r), self.y1)
+        for y in range(first, last):
+            dy = y + 0.5 - cy
+            if abs(dy) > r:
+                continue
+            dx = math.sqrt(r * r - dy * dy)
+            self.span(y, cx - dx, cx + dx, outline)
+            if abs(dy) < inner:
+                dx = math.sqrt(inner * inner - dy * dy)
+                self.span(y, cx - dx, cx + dx, fill)
+
+    def text(self, cx, cy, label, color, size, max_width):
+        label = label.upper()
+        k = min(int(size * 0.7 / 5), int(max_width / (4 * len(label) - 1)))
+        if k < 1:
+            return
+        left = round(cx - (4 * len(label) - 1) * k / 2)
+        top = round(cy - 5 * k / 2)
+        if top + 5 * k <= self.y0 or top >= self.y1:
+            return
+        for n, char in enumerate(label):
+            bits = _GLYPHS.get(char)
+            if bits is None:
+                continue
+            x = left + 4 * n * k
+            for row in range(5):
+                for col in range(3):
+                    if bits[3 * row + col] == "1":
+                        for y in range(top + row * k, top + (row + 1) * k):
+                            self.span(y, x + col * k, x + (col + 1) * k, color)
+
+class PillowStrip:
+    """Same interface as Strip, drawn with Pillow (antialiased text, real fonts)."""
+    _fonts = {}
+
+    def __init__(self, width, y0, y1, background):
+        self.width = width
+        self.y0 = y0
+        self.y1 = y1
+        self.image = Image.new("RGB", (width, y1 - y0), tuple(background))
+        self.draw = ImageDraw.Draw(self.image)
+
+    @staticmethod
+    def color(spec):
+        return spec
+
+    def rows(self):
+        data = self.image.tobytes()
+        stride = 3 * self.width
+        for i in range(self.y1 - self.y0):
+            yield data[i * stride:(i + 1) * stride]
+
+    def dot(self, x, y, color):
+        self.draw.point((x, y - self.y0), fill=color)
+
+    def lines(self, segments, y0, y1, color, width):
+        y0 -= self.y0
+        y1 -= self.y0
+        for x0, x1 in segments:
+            self.draw.line((x0, y0, x1, y1), fill=color, width=width)
+
+    def circle(self, cx, cy, r, fill, outline, width):
+        cy -= self.y0
+        self.draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=fill, outline=outline, width=width)
+
+    def text(self, cx, cy, label, color, size, max_width):
+        font = self._font(size)
+        left, top, right, bottom = self.draw.textbbox((0, 0), label, font=font)
+        self.draw.text((cx - (left + right) / 2, cy - self.y0 - (top + bottom) / 2),
+                       label, fill=color, font=font)
+
+    @classmethod
+    def _font(cls, size):
+        if size not in cls._fonts:
+            try:
+                cls._fonts[size] = ImageFont.truetype("DejaVuSans-Bold.ttf", size)
+            except OSError:
+                cls._fonts[size] = ImageFont.load_default()
+        return cls._fonts[size]
+
+def draw_strip(strip, geometry):
+    """Draw every edge, node and label that reaches into strip's rows."""
+    layout, style, g = geometry.layout, geometry.style, geometry
+    if not len(layout):
+        return
+    r = g.radius
+    edge_width = g.line_width(style.edge_width)
+    outline_width = g.line_width(style.outline_width)
+    reach = r + max(edge_width, outline_width) + 1
+    d_lo = max(0, math.floor((strip.y0 - g.margin - reach) / g.level))
+    d_hi = min(layout.height, math.floor((strip.y1 - g.margin + reach) / g.level) + 2)
+    colors = {}
+
+    def color(spec):
+        if spec not in colors:
+            colors[spec] = strip.color(spec)
+        return colors[spec]
+
+    edge_color = color(style.edge_fill)
+    x, parent, starts = layout.x, layout.parent, layout.level_starts
+    for d in range(max(1, d_lo), d_hi):
+        y, py = g.level_y(d) - r, g.level_y(d - 1) + r
+        if py - reach >= strip.y1 or y + reach <= strip.y0:
+            continue
+        segments = []
+        last = None
+        for i in range(starts[d], starts[d + 1]):
+            x0, x1 = g.node_x(parent[i]), g.node_x(i)
+            # Crowded levels repeat the same pixels many times over
+            key = (round(x0), round(x1))
+            if key != last:
+                segments.append((x0, x1))
+                last = key
+        strip.lines(segments, py, y, edge_color, edge_width)
+
+    labels = r >= MIN_LABEL_RADIUS
+    size = g.font_size()
+    text_color = color(style.text_fill)
+    for d in range(d_lo, d_hi):
+        y = g.level_y(d)
+        if y - reach >= strip.y1 or y + reach <= strip.y0:
+            continue
+        last = None
+        for i in range(starts[d], starts[d + 1]):
+            node = layout.nodes[i]
+            cx = g.node_x(i)
+            fill, outline = style.colors(node)
+            if r < 1:
+                key = (round(cx), fill)
+                if key != last:
+                    strip.dot(cx, y, color(fill))
+                    last = key
+                continue
+            strip.circle(cx, y, r, color(fill), color(outline), outline_width)
+            if labels:
+                strip.text(cx, y, style.label(node), text_color, size, 1.6 * r)
+
+def write_png(out, geometry, background="white", strip_rows=64, use_pillow=None):
+    """Write the laid-out tree to binary stream out as PNG, strip by strip.
+
+    use_pillow: True/False to force a rasterizer; None uses Pillow if present.
+    """
+    if use_pillow is None:
+        use_pillow = Image is not None
+    elif use_pillow and Image is None:
+        raise ImportError("Pillow is not installed (pip install pillow)")
+    strip_class = PillowStrip if use_pillow else Strip
+    background = parse_color(background)
+    writer = PNGWriter(out, geometry.width, geometry.height)
+    for y0 in range(0, geometry.height, strip_rows):
+        strip = strip_class(geometry.width, y0, min(geometry.height, y0 + strip_rows), background)
+        draw_strip(strip, geometry)
+        for row in strip.rows():
+            writer.write_row(row)
+    writer.close()
+
+def export_tree(root, path, nil=None, style=None, layout=None, scale=1.0,
+                max_width=8192, max_height=8192, background="white", use_pillow=None):
+    """Write the tree under root to path as SVG or PNG, chosen by its suffix.
+
+    SVG is drawn at ``scale``; PNG is shrunk per axis to fit max_width x
+    max_height. ``nil`` is the leaf sentinel, as for tidy_layout.
+    """
+    style = style or NodeStyle()
+    layout = layout if layout is not None else tidy_layout(root, nil)
+    lower = str(path).lower()
+    if lower.endswith(".svg"):
+        with open(path, "w", encoding="utf-8") as out:
+            write_svg(out, Geometry(layout, style, scale, scale), background)
+    elif lower.endswith(".png"):
+        with open(path, "wb") as out:
+            write_png(out, Geometry.fit(layout, style, max_width, max_height), background,
+                      use_pillow=use_pillow)
+    else:
+        raise ValueError(f"Unknown image type for {path}: use .svg or .png")
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m treeconverter.export",
+        description="Draw a space-separated level order ('null' for None) as SVG or PNG.",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="level order file, or '-' for stdin (default)")
+    parser.add_argument("-o", "--output", required=True, help="image file, .svg or .png")
+    parser.add_argument("--scale", type=float, default=1.0, help="SVG scale (default: 1)")
+    parser.add_argument("--max-width", type=int, default=8192,
+                        help="PNG width limit in pixels (default: 8192)")
+    parser.add_argument("--max-height", type=int, default=8192,
+                        help="PNG height limit in pixels (default: 8192)")
+    parser.add_argument("--no-pillow", action="store_true",
+                        help="use the built-in rasterizer even if Pillow is installed")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.output.lower().endswith((".svg", ".png")):
+        parser.error("output must be a .svg or .png file")
+    if args.input == "-":
+        root = construct_tree_level_order(iter_tokens(sys.stdin))
+    else:
+        with open(args.input) as stream:
+            root = construct_tree_level_order(iter_tokens(stream))
+    export_tree(root, args.output, style=NodeStyle(label_attr="val"), scale=args.scale,
+                max_width=args.max_width, max_height=args.max_height,
+                use_pillow=False if args.no_pillow else None)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
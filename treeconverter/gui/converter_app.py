@@ -0,0 +1,201 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from treeconverter import traversal
+from treeconverter.converter import (
+    PAIR_TYPES,
+    TRAVERSAL_TYPES,
+    build_tree_from_traversals,
+    construct_tree_level_order,
+)
+from treeconverter.gui.renderer import NodeStyle, TreeRenderer
+from treeconverter.gui.worker import TaskPanel
+from treeconverter.layout import tidy_layout
+
+class LNCTDSAConverter:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("LNCT DSA CONVERTER")
+        screen_w = self.root.winfo_screenwidth()
+        screen_h = self.root.winfo_screenheight()
+        width = int(screen_w * 0.8)
+        height = int(screen_h * 0.8)
+        self.root.geometry(f"{width}x{height}")
+        self.root.configure(bg="#f0f0f0")
+
+        self.tree = None
+        self.tree_size = 0
+        self.canvas = None
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        # Header
+        header = tk.Frame(self.root, bg="#007acc", height=80)
+        header.pack(fill="x")
+        header.pack_propagate(False)
+
+        title = tk.Label(header, text="LNCT DSA CONVERTER", font=("Arial", 28, "bold"),
+                         fg="white", bg="#007acc")
+        title.pack(expand=True)
+
+        # Main Container
+        main_frame = tk.Frame(self.root, bg="#f0f0f0")
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # Left Panel
+        left_panel = tk.Frame(main_frame, bg="white", relief="groove", bd=2)
+        left_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
+        
+        # Right Panel
+        right_panel = tk.Frame(main_frame, bg="white", relief="groove", bd=2)
+        right_panel.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
+
+        main_frame.grid_columnconfigure(0, weight=1)
+        main_frame.grid_columnconfigure(1, weight=1)
+        main_frame.grid_rowconfigure(0, weight=1)
+
+        self.setup_left_panel(left_panel)
+        self.setup_right_panel(right_panel)
+
+        # Progress of background work
+        self.tasks = TaskPanel(self.root, bg="#f0f0f0")
+        self.tasks.pack(side="bottom", fill="x", padx=20, pady=(0, 10))
+
+        # Canvas with Scrollbars for Tree Visualization
+        canvas_frame = tk.Frame(self.root, bg="white")
+        canvas_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        # === Scrollbars Added ===
+        self.canvas = tk.Canvas(canvas_frame, bg="white", highlightthickness=0, scrollregion=(0, 0, 2000, 2000))
+        hbar = tk.Scrollbar(canvas_frame, orient="horizontal", command=self.canvas.xview)
+        vbar = tk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+        style = NodeStyle(radius=20, x_step=50, y_step=70, fill="#4CAF50", outline="black",
+                          outline_width=1, font_size=12, edge_fill="black", edge_width=1,
+                          label_attr="val")
+        self.renderer = TreeRenderer(self.canvas, style, hbar, vbar, top=30)
+
+        hbar.pack(side="bottom", fill="x")
+        vbar.pack(side="right", fill="y")
+        self.canvas.pack(fill="both", expand=True, side="left")
+
+    def setup_left_panel(self, parent):
+        tk.Label(parent, text="Build Tree & Convert", font=("Arial", 16, "bold"), bg="white").pack(pady=10)
+
+        tk.Label(parent, text="Enter Level Order (space separated, 'null' for None):", bg="white").pack(anchor="w", padx=20)
+        self.level_input = tk.Entry(parent, width=50)
+        self.level_input.pack(pady=5, padx=20)
+
+        tk.Button(parent, text="Build Tree from Level Order", bg="#28a745", fg="white",
+                  command=self.build_tree_from_level).pack(pady=5)
+
+        tk.Label(parent, text="Convert to:", bg="white").pack(anchor="w", padx=20, pady=(15,5))
+        self.convert_var = tk.StringVar(value="Inorder")
+        convert_menu = ttk.Combobox(parent, textvariable=self.convert_var,
+                                    values=TRAVERSAL_TYPES, state="readonly", width=20)
+        convert_menu.pack(pady=5)
+
+        tk.Button(parent, text="Convert Tree", bg="#007acc", fg="white",
+                  command=self.convert_tree).pack(pady=10)
+
+        self.left_result = tk.Text(parent, height=4, width=50, state="disabled", bg="#f8f9fa")
+        self.left_result.pack(pady=10, padx=20)
+
+    def setup_right_panel(self, parent):
+        tk.Label(parent, text="Build Tree from Traversals", font=("Arial", 16, "bold"), bg="white").pack(pady=10)
+
+        tk.Label(parent, text="Select First Traversal:", bg="white").pack(anchor="w", padx=20)
+        self.trav1_var = tk.StringVar(value="Inorder")
+        trav1_menu = ttk.Combobox(parent, textvariable=self.trav1_var,
+                                  values=PAIR_TYPES, state="readonly")
+        trav1_menu.pack(pady=5)
+
+        tk.Label(parent, text="Enter values (space separated):", bg="white").pack(anchor="w", padx=20)
+        self.trav1_input = tk.Entry(parent, width=40)
+        self.trav1_input.pack(pady=5, padx=20)
+
+        tk.Label(parent, text="Select Second Traversal:", bg="white").pack(anchor="w", padx=20, pady=(15,5))
+        self.trav2_var = tk.StringVar(value="Preorder")
+        trav2_menu = ttk.Combobox(parent, textvariable=self.trav2_var,
+                                  values=PAIR_TYPES, state="readonly")
+        trav2_menu.pack(pady=5)
+
+        tk.Label(parent, text="Enter values (space separated):", bg="white").pack(anchor="w", padx=20)
+        self.trav2_input = tk.Entry(parent, width=40)
+        self.trav2_input.pack(pady=5, padx=20)
+
+        tk.Button(parent, text="Build Tree from Traversals", bg="#dc3545", fg="white",
+                  command=self.build_tree_from_traversals).pack(pady=15)
+
+    def build_tree_from_level(self):
+        values = self.level_input.get().strip().split()
+        if not values:
+            messagebox.showerror("Error", "Invalid input: Empty input")
+            return
+
+        def job(task):
+            tree = construct_tree_level_order(
+                task.iterate(values, len(values), "Reading level order..."))
+            task.progress(None, "Laying out...")
+            return tree, tidy_layout(tree)
+
+        def done(result):
+            self.set_tree(*result)
+            messagebox.showinfo("Success", "Tree built from level order!")
+
+        self.tasks.run(job, done, lambda e: messagebox.showerror("Error", f"Invalid input: {e}"),
+                       "Building tree...")
+
+    def convert_tree(self):
+        if not self.tree:
+            messagebox.showwarning("No Tree", "Build a tree first!")
+            return
+        tree, size = self.tree, self.tree_size
+        choice = self.convert_var.get()
+
+        def job(task):
+            return " ".join(task.iterate(traversal.traverse(tree, choice), size,
+                                         f"{choice} traversal..."))
+
+        def done(output):
+            self.left_result.config(state="normal")
+            self.left_result.delete(1.0, tk.END)
+            self.left_result.insert(tk.END, f"{choice}: {output}")
+            self.left_result.config(state="disabled")
+
+        self.tasks.run(job, done, message="Converting...")
+
+    def build_tree_from_traversals(self):
+        trav1 = self.trav1_input.get().strip().split()
+        trav2 = self.trav2_input.get().strip().split()
+        t1, t2 = self.trav1_var.get(), self.trav2_var.get()
+
+        def job(task):
+            tree = build_tree_from_traversals(trav1, t1, trav2, t2)
+            task.progress(None, "Laying out...")
+            return tree, tidy_layout(tree)
+
+        def done(result):
+            self.set_tree(*result)
+            messagebox.showinfo("Success", f"Tree built from {t1} + {t2}!")
+
+        self.tasks.run(job, done, message=f"Building tree from {t1} + {t2}...")
+
+    def set_tree(self, tree, layout):
+        self.tree = tree
+        self.tree_size = len(layout)
+        self.draw_tree(layout)
+
+    def draw_tree(self, layout=None):
+        self.canvas.delete("message")
+        if not self.tree:
+            self.renderer.clear()
+            return
+        self.canvas.create_text(600, 30, text="Binary Tree Visualization", font=("Arial", 14, "bold"), fill="#333",
+                                tags="message")
+        self.renderer.show(self.tree, layout=layout)
+
+def main():
+    root = tk.Tk()
+    app = LNCTDSAConverter(root)
+    root.mainloop()
@@ -0,0 +1,247 @@
+import tkinter as tk
+from operator import attrgetter
+from tkinter import ttk, messagebox
+
+from treeconverter.gui.renderer import RedBlackStyle, TreeRenderer
+from treeconverter.gui.worker import TaskPanel
+from treeconverter.layout import tidy_layout
+from treeconverter.rbt import RedBlackTree
+
+class RBTMakerApp:
+    # Turns one comma-separated entry into a tree value
+    parse_value = staticmethod(int)
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title("RBT (Red Black Tree) MAKER")
+        self.root.geometry("1000x700")
+        self.root.configure(bg="#1a1a2e")
+        
+        self.rbt = RedBlackTree()
+        
+        self.setup_ui()
+    
+    def setup_ui(self):
+        # Heading
+        heading = tk.Label(
+            self.root,
+            text="🔴⚫ RBT (Red Black Tree) MAKER ⚫🔴",
+            font=("Arial", 26, "bold"),
+            bg="#1a1a2e",
+            fg="#eee"
+        )
+        heading.pack(pady=20)
+        
+        # Control Frame
+        control_frame = tk.Frame(self.root, bg="#16213e", relief=tk.RAISED, bd=3)
+        control_frame.pack(pady=10, padx=20, fill=tk.X)
+        
+        # Values Input
+        tk.Label(
+            control_frame,
+            text="Enter Values (comma-separated):",
+            font=("Arial", 12, "bold"),
+            bg="#16213e",
+            fg="#eee"
+        ).grid(row=0, column=0, padx=10, pady=15, sticky="w")
+        
+        self.values_entry = tk.Entry(
+            control_frame,
+            font=("Arial", 11),
+            width=35,
+            relief=tk.SOLID,
+            bd=2
+        )
+        self.values_entry.grid(row=0, column=1, padx=10, pady=15)
+        
+        # Build Tree Button
+        build_btn = tk.Button(
+            control_frame,
+            text="🌲 Build RBT",
+            font=("Arial", 12, "bold"),
+            bg="#e63946",
+            fg="white",
+            activebackground="#d62828",
+            relief=tk.RAISED,
+            bd=3,
+            padx=15,
+            pady=5,
+            command=self.build_tree
+        )
+        build_btn.grid(row=0, column=2, padx=10, pady=15)
+        
+        # Delete Node Section
+        tk.Label(
+            control_frame,
+            text="Delete Node:",
+            font=("Arial", 12, "bold"),
+            bg="#16213e",
+            fg="#eee"
+        ).grid(row=1, column=0, padx=10, pady=15, sticky="w")
+        
+        self.delete_entry = tk.Entry(
+            control_frame,
+            font=("Arial", 11),
+            width=35,
+            relief=tk.SOLID,
+            bd=2
+        )
+        self.delete_entry.grid(row=1, column=1, padx=10, pady=15)
+        
+        delete_btn = tk.Button(
+            control_frame,
+            text="🗑️ Delete Node",
+            font=("Arial", 12, "bold"),
+            bg="#f77f00",
+            fg="white",
+            activebackground="#d62828",
+            relief=tk.RAISED,
+            bd=3,
+            padx=15,
+            pady=5,
+            command=self.delete_node
+        )
+        delete_btn.grid(row=1, column=2, padx=10, pady=15)
+        
+        # Clear Tree Button
+        clear_btn = tk.Button(
+            control_frame,
+            text="🔄 Clear Tree",
+            font=("Arial", 12, "bold"),
+            bg="#457b9d",
+            fg="white",
+            activebackground="#1d3557",
+            relief=tk.RAISED,
+            bd=3,
+            padx=15,
+            pady=5,
+            command=self.clear_tree
+        )
+        clear_btn.grid(row=1, column=3, padx=10, pady=15)
+        
+        # Progress of background work
+        self.tasks = TaskPanel(self.root, bg="#1a1a2e", fg="#f8f9fa")
+        self.tasks.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 10))
+        
+        # Canvas Frame with Scrollbars
+        canvas_frame = tk.Frame(self.root, bg="#1a1a2e")
+        canvas_frame.pack(pady=20, padx=20, fill=tk.BOTH, expand=True)
+        
+        # Create canvas with scrollbars
+        self.canvas = tk.Canvas(
+            canvas_frame,
+            bg="#f8f9fa",
+            relief=tk.SUNKEN,
+            bd=3,
+            scrollregion=(0, 0, 2000, 2000)
+        )
+        
+        h_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        v_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        
+        self.renderer = TreeRenderer(self.canvas, RedBlackStyle(), h_scrollbar, v_scrollbar)
+        
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    
+    def build_tree(self):
+        values_str = self.values_entry.get().strip()
+        if not values_str:
+            messagebox.showwarning("Warning", "Please enter some values!")
+            return
+        
+        parse_value = self.parse_value
+        
+        def job(task):
+            # Runs on a worker thread: build into a fresh tree, not the shown one
+            parts = values_str.split(",")
+            values = [parse_value(x.strip())
+                      for x in task.iterate(parts, len(parts), "Reading values...")]
+            rbt = RedBlackTree()
+            task.progress(None, f"Building {len(values)} nodes...")
+            rbt.build(values)
+            task.progress(None, "Laying out...")
+            return rbt, tidy_layout(rbt.root, rbt.NIL)
+        
+        def done(result):
+            rbt, layout = result
+            self.rbt = rbt
+            self.draw_tree(layout=layout)
+            messagebox.showinfo("Success", "Red Black Tree created successfully!")
+        
+        def error(e):
+            if isinstance(e, ValueError):
+                messagebox.showerror("Error", "Please enter valid comma-separated numbers!")
+            else:
+                messagebox.showerror("Error", str(e))
+        
+        self.tasks.run(job, done, error, "Building tree...")
+    
+    def delete_node(self):
+        if self.rbt.root is self.rbt.NIL:
+            messagebox.showwarning("Warning", "Please create a tree first!")
+            return
+        
+        try:
+            value = self.parse_value(self.delete_entry.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number to delete!")
+            return
+        
+        shown = self.rbt
+        
+        def job(task):
+            # The shown tree is still being drawn, so delete from a copy
+            if value not in shown:
+                return None
+            rbt = shown.copy()
+            rbt.delete(value)
+            task.progress(None, "Laying out...")
+            return rbt, tidy_layout(rbt.root, rbt.NIL)
+        
+        def done(result):
+            if result is None:
+                messagebox.showwarning("Warning", f"Node {value} not found in tree!")
+                return
+            self.rbt, layout = result
+            self.draw_tree(update=True, layout=layout)
+            self.delete_entry.delete(0, tk.END)
+            messagebox.showinfo("Success", f"Node {value} deleted successfully!")
+        
+        self.tasks.run(job, done, message=f"Deleting {value}...")
+    
+    def clear_tree(self):
+        self.tasks.cancel()
+        self.rbt = RedBlackTree()
+        self.values_entry.delete(0, tk.END)
+        self.delete_entry.delete(0, tk.END)
+        self.draw_tree()
+        messagebox.showinfo("Success", "Tree cleared successfully!")
+    
+    def draw_tree(self, update=False, layout=None):
+        self.canvas.delete("message")
+        
+        if self.rbt.root is self.rbt.NIL:
+            self.renderer.clear()
+            self.canvas.create_text(
+                500, 300,
+                text="Tree is empty!",
+                font=("Arial", 24, "bold"),
+                fill="#6c757d",
+                tags="message"
+            )
+            return
+        
+        if update:
+            # A copy of the shown tree minus one node: match nodes by key
+            # so only what the delete moved is redrawn
+            self.renderer.update(self.rbt.root, self.rbt.NIL, layout=layout,
+                                 key=attrgetter("key"))
+        else:
+            self.renderer.show(self.rbt.root, self.rbt.NIL, layout)
+
+def main():
+    root = tk.Tk()
+    app = RBTMakerApp(root)
+    root.mainloop()
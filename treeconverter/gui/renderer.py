@@ -0,0 +1,438 @@
+"""Canvas rendering of a TreeLayout that only draws what is on screen.
+
+Only nodes inside the scrolled viewport get canvas items, and the view is
+redrawn whenever it scrolls, zooms or resizes. Levels too crowded to read
+at the current zoom, and every level once ``max_nodes`` individual nodes
+are on screen, are drawn as summary bands: one bar per run of occupied
+pixel bins, found by bisecting the level's sorted x coordinates. A redraw
+therefore costs about the size of the viewport, not the size of the tree.
+
+Canvas items are kept per node (by identity) between redraws, or by a
+caller-given key across an update from an edited copy of the tree. After
+an update or a scroll the new positions, colors and labels are compared with
+what is on the canvas and only the differences are sent to Tk, optionally
+as a short animation.
+
+Ctrl + mouse wheel zooms around the pointer; the wheel scrolls vertically
+and Shift + wheel horizontally.
+"""
+from bisect import bisect_right
+
+from treeconverter.layout import tidy_layout
+
+class NodeStyle:
+    """Sizes and colors for one app's trees; any attribute can be overridden."""
+    radius = 25
+    x_step = 70
+    y_step = 100
+    margin = 50
+    fill = "#27ae60"
+    outline = "#229954"
+    outline_width = 3
+    font_family = "Arial"
+    font_size = 14
+    text_fill = "white"
+    edge_fill = "#34495e"
+    edge_width = 3
+    summary_fill = "#95a5a6"
+    label_attr = "data"
+
+    def __init__(self, **options):
+        for name, value in options.items():
+            setattr(self, name, value)
+
+    def colors(self, node):
+        return self.fill, self.outline
+
+    def label(self, node):
+        return str(getattr(node, self.label_attr))
+
+class RedBlackStyle(NodeStyle):
+    radius = 28
+    x_step = 76
+    font_size = 13
+    edge_fill = "#495057"
+
+    def colors(self, node):
+        if node.color == "RED":
+            return "#e63946", "#d62828"
+        return "#212529", "#000000"
+
+class _Drawn:
+    # Canvas items of one node and the values they currently show
+    __slots__ = ("node", "oval", "text", "edge", "xy", "edge_xy", "colors", "label", "scale")
+
+    def __init__(self, node):
+        self.node = node  # keeps id(node) from being reused while drawn
+        self.oval = self.text = self.edge = None
+        self.xy = self.edge_xy = self.colors = self.label = self.scale = None
+
+class TreeRenderer:
+    # Below this many pixels per node a level is drawn as summary bands
+    min_node_px = 4
+    # Width of the pixel bins summary bands are built from
+    bin_px = 6
+    # Labels are dropped once a node is smaller than this on screen
+    min_label_radius = 9
+    max_nodes = 3000
+    min_scale, max_scale = 0.01, 4.0
+    # Animated updates move items in this many steps over this many ms
+    animation_steps = 8
+    animation_ms = 240
+
+    def __init__(self, canvas, style=None, hbar=None, vbar=None, top=0):
+        self.canvas = canvas
+        self.style = style or NodeStyle()
+        self.hbar = hbar
+        self.vbar = vbar
+        self.top = top  # space kept free above the root
+        self.layout = tidy_layout(None)
+        self.scale = 1.0
+        self.left = self.style.margin
+        self.region = (0, 0, 0, 0)
+        self.drawn = {}  # id(node) -> _Drawn
+        self._pending = None
+        self._animation = None  # (after id, moves, step)
+
+        canvas.configure(xscrollcommand=self._on_xview, yscrollcommand=self._on_yview)
+        canvas.bind("<Configure>", lambda event: self.schedule())
+        canvas.bind("<Control-MouseWheel>",
+                    lambda event: self.zoom(1.25 if event.delta > 0 else 0.8, event.x, event.y))
+        canvas.bind("<Control-Button-4>", lambda event: self.zoom(1.25, event.x, event.y))
+        canvas.bind("<Control-Button-5>", lambda event: self.zoom(0.8, event.x, event.y))
+        canvas.bind("<MouseWheel>",
+                    lambda event: canvas.yview_scroll(-1 if event.delta > 0 else 1, "units"))
+        canvas.bind("<Shift-MouseWheel>",
+                    lambda event: canvas.xview_scroll(-1 if event.delta > 0 else 1, "units"))
+        canvas.bind("<Button-4>", lambda event: canvas.yview_scroll(-1, "units"))
+        canvas.bind("<Button-5>", lambda event: canvas.yview_scroll(1, "units"))
+
+    def _on_xview(self, first, last):
+        if self.hbar is not None:
+            self.hbar.set(first, last)
+        self.schedule()
+
+    def _on_yview(self, first, last):
+        if self.vbar is not None:
+            self.vbar.set(first, last)
+        self.schedule()
+
+    def schedule(self):
+        # Coalesce bursts of scroll events into one redraw
+        if self._pending is None:
+            self._pending = self.canvas.after_idle(self._render_pending)
+
+    def _render_pending(self):
+        self._pending = None
+        self.render()
+
+    def show(self, root, nil=None, layout=None):
+        """Lay out a new tree, scroll its root into view and draw what is visible.
+
+        Pass ``layout`` if the tree was already laid out, e.g. on a worker thread.
+        """
+        self.layout = layout if layout is not None else tidy_layout(root, nil)
+        self.center()
+        self.update_scrollregion()
+        if len(self.layout):
+            self.scroll_to(self.node_x(0) - self.canvas.winfo_width() / 2, self.region[1])
+        self.render()
+
+    def update(self, root, nil=None, animate=True, layout=None, key=None):
+        """Redraw after the tree changed, keeping the view where it is.
+
+        The old root stays put on the canvas (or the new root, if the old
+        one is gone), so nodes whose layout did not change keep their
+        items untouched. As with show(), ``layout`` may be precomputed.
+        If the change was made on a copy, pass ``key`` (e.g. the search
+        key of a node) so the copy's nodes take over the old nodes' items.
+        """
+        old = self.layout
+        anchor = None
+        if len(old):
+            anchor = old.nodes[0]
+            anchor_px = self.node_x(0)
+        self.layout = layout if layout is not None else tidy_layout(root, nil)
+        if anchor is not None and len(self.layout):
+            index = max(0, self.layout.find(anchor, key))
+            self.left = anchor_px - self.layout.x[index] * self.unit_px()
+        else:
+            self.center()
+        self.update_scrollregion()
+        self.render(animate, key)
+
+    def clear(self):
+        self.layout = tidy_layout(None)
+        self.render()
+
+    # Geometry
+
+    def unit_px(self):
+        return self.style.x_step * self.scale
+
+    def level_px(self):
+        return self.style.y_step * self.scale
+
+    def node_x(self, i):
+        return self.left + self.layout.x[i] * self.unit_px()
+
+    def level_y(self, d):
+        return self.top + self.style.margin + d * self.level_px()
+
+    def center(self):
+        # Center the tree when it is narrower than the canvas
+        tree_w = self.layout.width * self.unit_px()
+        self.left = max(self.style.margin, (self.canvas.winfo_width() - tree_w) / 2)
+
+    def update_scrollregion(self):
+        style, canvas = self.style, self.canvas
+        tree_w = self.layout.width * self.unit_px()
+        tree_h = max(0, self.layout.height - 1) * self.level_px()
+        # Updates can push the tree left of x = 0, so the region may start there
+        self.region = (min(0, self.left - style.margin), 0,
+                       max(canvas.winfo_width(), self.left + tree_w + style.margin),
+                       max(canvas.winfo_height(), self.top + tree_h + 2 * style.margin))
+        canvas.configure(scrollregion=self.region)
+
+    def scroll_to(self, x, y):
+        # Put canvas point (x, y) at the top left of the view
+        x0, y0, x1, y1 = self.region
+        self.canvas.xview_moveto(max(0.0, (x - x0) / (x1 - x0)))
+        self.canvas.yview_moveto(max(0.0, (y - y0) / (y1 - y0)))
+
+    def zoom(self, factor, x=None, y=None):
+        """Scale the drawing by factor, keeping the point under (x, y) in place."""
+        canvas = self.canvas
+        scale = min(self.max_scale, max(self.min_scale, self.scale * factor))
+        if scale == self.scale or not len(self.layout):
+            return
+        if x is None:
+            x, y = canvas.winfo_width() / 2, canvas.winfo_height() / 2
+        # Layout coordinates of the anchor point
+        cx, cy = canvas.canvasx(x), canvas.canvasy(y)
+        ux = (cx - self.left) / self.unit_px()
+        uy = (cy - self.top - self.style.margin) / self.level_px()
+        self.scale = scale
+        self.update_scrollregion()
+        self.scroll_to(self.left + ux * self.unit_px() - x,
+                       self.top + self.style.margin + uy * self.level_px() - y)
+        self.schedule()
+
+    # Drawing
+
+    def visible_window(self):
+        """Return (depth_lo, depth_hi, x_lo, x_hi) of the viewport in layout units."""
+        canvas, style = self.canvas, self.style
+        x0, x1 = canvas.canvasx(0), canvas.canvasx(canvas.winfo_width())
+        y0, y1 = canvas.canvasy(0), canvas.canvasy(canvas.winfo_height())
+        pad = style.radius * self.scale
+        unit, level = self.unit_px(), self.level_px()
+        base = self.top + style.margin
+        d_lo = max(0, int((y0 - pad - base) // level))
+        d_hi = min(self.layout.height, int((y1 + pad - base) // level) + 1)
+        return (d_lo, d_hi, (x0 - pad - self.left) / unit, (x1 + pad - self.left) / unit)
+
+    def plan(self):
+        """Split the visible levels into individually drawn ranges and summary levels.
+
+        Returns (detail, summary): lists of (depth, lo, hi) index ranges.
+        """
+        layout = self.layout
+        if not len(layout):
+            return [], []
+        d_lo, d_hi, x_lo, x_hi = self.visible_window()
+        view_px = self.canvas.winfo_width() or 1
+        detail, summary = [], []
+        budget = self.max_nodes
+        for d in range(d_lo, d_hi):
+            lo, hi = layout.visible(d, x_lo, x_hi)
+            if lo == hi:
+                continue
+            count = hi - lo
+            if count > budget or count * self.min_node_px > view_px:
+                summary.append((d, lo, hi))
+                budget = 0  # everything deeper is at least as crowded
+            else:
+                detail.append((d, lo, hi))
+                budget -= count
+        return detail, summary
+
+    def render(self, animate=False, key=None):
+        """Bring the canvas in line with the layout, touching only what changed.
+
+        With ``key`` the drawn items are matched to nodes by key(node)
+        rather than by identity.
+        """
+        self._finish_animation()
+        canvas, style, layout = self.canvas, self.style, self.layout
+        detail, summary = self.plan()
+        old, drawn = self.drawn, {}
+        if key is not None:
+            old = {key(item.node): item for item in old.values()}
+        moves = []
+        new_edges = False
+        r = style.radius * self.scale
+        for d, lo, hi in detail:
+            y = self.level_y(d)
+            py = self.level_y(d - 1) + r
+            for i in range(lo, hi):
+                node = layout.nodes[i]
+                item = old.pop(id(node) if key is None else key(node), None)
+                if item is None:
+                    item = _Drawn(node)
+                item.node = node
+                drawn[id(node)] = item
+                x = self.node_x(i)
+                p = layout.parent[i]
+                edge_xy = None if p < 0 else (self.node_x(p), py, x, y - r)
+                new_edges |= item.edge is None and edge_xy is not None
+                if animate and item.xy is not None and (item.xy != (x, y) or item.edge_xy != edge_xy):
+                    moves.append((item, item.xy, item.edge_xy))
+                self.draw_node(item, x, y, edge_xy)
+        for item in old.values():
+            for item_id in (item.oval, item.text, item.edge):
+                if item_id is not None:
+                    canvas.delete(item_id)
+        self.drawn = drawn
+        if new_edges:
+            canvas.tag_lower("edge")
+
+        canvas.delete("summary")
+        for d, lo, hi in summary:
+            self.draw_summary(d, lo, hi)
+        if moves:
+            self._start_animation(moves)
+
+    def draw_node(self, item, x, y, edge_xy):
+        """Create or adjust one node's items so they show (x, y) and edge_xy."""
+        style, canvas = self.style, self.canvas
+        node = item.node
+        r = style.radius * self.scale
+        colors = style.colors(node)
+        label = style.label(node) if r >= self.min_label_radius else None
+        rescaled = item.scale != self.scale
+
+        if item.oval is None:
+            item.oval = canvas.create_oval(x - r, y - r, x + r, y + r, tags=("tree", "node"))
+            rescaled = True
+            item.colors = None
+        elif item.xy != (x, y) or rescaled:
+            canvas.coords(item.oval, x - r, y - r, x + r, y + r)
+        if rescaled:
+            canvas.itemconfigure(item.oval, width=max(1, round(style.outline_width * self.scale)))
+        if item.colors != colors:
+            canvas.itemconfigure(item.oval, fill=colors[0], outline=colors[1])
+
+        if label is None:
+            if item.text is not None:
+                canvas.delete(item.text)
+                item.text = None
+        elif item.text is None:
+            item.text = canvas.create_text(x, y, text=label, fill=style.text_fill,
+                                           font=self._font(), tags=("tree", "label"))
+        else:
+            if item.xy != (x, y):
+                canvas.coords(item.text, x, y)
+            if item.label != label:
+                canvas.itemconfigure(item.text, text=label)
+            if rescaled:
+                canvas.itemconfigure(item.text, font=self._font())
+
+        if edge_xy is None:
+            if item.edge is not None:
+                canvas.delete(item.edge)
+                item.edge = None
+        elif item.edge is None:
+            item.edge = canvas.create_line(*edge_xy, fill=style.edge_fill,
+                                           width=max(1, round(style.edge_width * self.scale)),
+                                           tags=("tree", "edge"))
+        else:
+            if item.edge_xy != edge_xy:
+                canvas.coords(item.edge, *edge_xy)
+            if rescaled:
+                canvas.itemconfigure(item.edge, width=max(1, round(style.edge_width * self.scale)))
+
+        item.xy, item.edge_xy, item.colors, item.label = (x, y), edge_xy, colors, label
+        item.scale = self.scale
+
+    def _font(self):
+        style = self.style
+        return (style.font_family, max(6, round(style.font_size * self.scale)), "bold")
+
+    # Animation
+
+    def _start_animation(self, moves):
+        # Items already show their final state; rewind the movers and replay
+        self._animation = [None, moves, 0]
+        self._animate_step()
+
+    def _animate_step(self):
+        if self._animation is None:
+            return
+        after_id, moves, step = self._animation
+        step += 1
+        t = step / self.animation_steps
+        for item, start, edge_start in moves:
+            self._place(item, start, edge_start, t)
+        if step >= self.animation_steps:
+            self._animation = None
+            return
+        self._animation[2] = step
+        self._animation[0] = self.canvas.after(
+            self.animation_ms // self.animation_steps, self._animate_step)
+
+    def _finish_animation(self):
+        if self._animation is None:
+            return
+        after_id, moves, _ = self._animation
+        self._animation = None
+        if after_id is not None:
+            self.canvas.after_cancel(after_id)
+        for item, start, edge_start in moves:
+            self._place(item, start, edge_start, 1.0)
+
+    def _place(self, item, start, edge_start, t):
+        # Move item's canvas items a fraction t of the way to their final place
+        canvas = self.canvas
+        r = self.style.radius * self.scale
+        x = start[0] + (item.xy[0] - start[0]) * t
+        y = start[1] + (item.xy[1] - start[1]) * t
+        canvas.coords(item.oval, x - r, y - r, x + r, y + r)
+        if item.text is not None:
+            canvas.coords(item.text, x, y)
+        if item.edge is not None:
+            if edge_start is None or t >= 1.0:
+                canvas.coords(item.edge, *item.edge_xy)
+            else:
+                canvas.coords(item.edge, *(a + (b - a) * t
+                                           for a, b in zip(edge_start, item.edge_xy)))
+
+    def draw_summary(self, d, lo, hi):
+        # One bar per run of occupied pixel bins across the viewport
+        layout, canvas = self.layout, self.canvas
+        x0 = canvas.canvasx(0)
+        bins = int(canvas.winfo_width() // self.bin_px) + 1
+        unit = self.unit_px()
+        y = self.level_y(d)
+        half = max(1.0, min(self.style.radius * self.scale, self.level_px() / 4))
+
+        def bar(first, last):
+            canvas.create_rectangle(x0 + first * self.bin_px, y - half,
+                                    x0 + last * self.bin_px, y + half,
+                                    fill=self.style.summary_fill, outline="",
+                                    tags=("tree", "summary"))
+
+        run_start = None
+        i = lo
+        for b in range(bins):
+            edge = (x0 + (b + 1) * self.bin_px - self.left) / unit
+            j = bisect_right(layout.x, edge, i, hi)
+            if j > i:
+                if run_start is None:
+                    run_start = b
+            elif run_start is not None:
+                bar(run_start, b)
+                run_start = None
+            i = j
+        if run_start is not None:
+            bar(run_start, bins)
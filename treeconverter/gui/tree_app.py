@@ -0,0 +1,248 @@
+import tkinter as tk
+from operator import attrgetter
+from tkinter import ttk, messagebox, scrolledtext
+
+from treeconverter.gui.renderer import NodeStyle, TreeRenderer
+from treeconverter.gui.worker import TaskPanel
+from treeconverter.layout import tidy_layout
+from treeconverter.tree import AVLTree, BinarySearchTree
+
+class TreeMakerApp:
+    # Turns one comma-separated entry into a tree value
+    parse_value = staticmethod(int)
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title("TREE MAKER")
+        self.root.geometry("1000x700")
+        self.root.configure(bg="#2c3e50")
+        
+        self.tree_root = None
+        self.tree_type = None
+        self.avl = AVLTree()
+        self.bst = BinarySearchTree()
+        
+        self.setup_ui()
+    
+    def setup_ui(self):
+        # Heading
+        heading = tk.Label(
+            self.root,
+            text="🌳 TREE MAKER 🌳",
+            font=("Arial", 28, "bold"),
+            bg="#2c3e50",
+            fg="#ecf0f1"
+        )
+        heading.pack(pady=20)
+        
+        # Control Frame
+        control_frame = tk.Frame(self.root, bg="#34495e", relief=tk.RAISED, bd=3)
+        control_frame.pack(pady=10, padx=20, fill=tk.X)
+        
+        # Tree Type Selection
+        tk.Label(
+            control_frame,
+            text="Select Tree Type:",
+            font=("Arial", 12, "bold"),
+            bg="#34495e",
+            fg="#ecf0f1"
+        ).grid(row=0, column=0, padx=10, pady=10, sticky="w")
+        
+        self.tree_type_var = tk.StringVar()
+        tree_dropdown = ttk.Combobox(
+            control_frame,
+            textvariable=self.tree_type_var,
+            values=["Create AVL Tree", "Create Binary Search Tree"],
+            font=("Arial", 11),
+            state="readonly",
+            width=25
+        )
+        tree_dropdown.grid(row=0, column=1, padx=10, pady=10)
+        tree_dropdown.current(0)
+        
+        # Values Input
+        tk.Label(
+            control_frame,
+            text="Enter Values (comma-separated):",
+            font=("Arial", 12, "bold"),
+            bg="#34495e",
+            fg="#ecf0f1"
+        ).grid(row=1, column=0, padx=10, pady=10, sticky="w")
+        
+        self.values_entry = tk.Entry(
+            control_frame,
+            font=("Arial", 11),
+            width=30,
+            relief=tk.SOLID,
+            bd=2
+        )
+        self.values_entry.grid(row=1, column=1, padx=10, pady=10)
+        
+        # Build Tree Button
+        build_btn = tk.Button(
+            control_frame,
+            text="🌲 Build Tree",
+            font=("Arial", 12, "bold"),
+            bg="#27ae60",
+            fg="white",
+            activebackground="#229954",
+            relief=tk.RAISED,
+            bd=3,
+            padx=15,
+            pady=5,
+            command=self.build_tree
+        )
+        build_btn.grid(row=1, column=2, padx=10, pady=10)
+        
+        # Delete Node Section
+        tk.Label(
+            control_frame,
+            text="Delete Node:",
+            font=("Arial", 12, "bold"),
+            bg="#34495e",
+            fg="#ecf0f1"
+        ).grid(row=2, column=0, padx=10, pady=10, sticky="w")
+        
+        self.delete_entry = tk.Entry(
+            control_frame,
+            font=("Arial", 11),
+            width=30,
+            relief=tk.SOLID,
+            bd=2
+        )
+        self.delete_entry.grid(row=2, column=1, padx=10, pady=10)
+        
+        delete_btn = tk.Button(
+            control_frame,
+            text="🗑️ Delete Node",
+            font=("Arial", 12, "bold"),
+            bg="#e74c3c",
+            fg="white",
+            activebackground="#c0392b",
+            relief=tk.RAISED,
+            bd=3,
+            padx=15,
+            pady=5,
+            command=self.delete_node
+        )
+        delete_btn.grid(row=2, column=2, padx=10, pady=10)
+        
+        # Progress of background work
+        self.tasks = TaskPanel(self.root, bg="#2c3e50", fg="#ecf0f1")
+        self.tasks.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 10))
+        
+        # Canvas Frame with Scrollbars
+        canvas_frame = tk.Frame(self.root, bg="#2c3e50")
+        canvas_frame.pack(pady=20, padx=20, fill=tk.BOTH, expand=True)
+        
+        # Create canvas with scrollbars
+        self.canvas = tk.Canvas(
+            canvas_frame,
+            bg="white",
+            relief=tk.SUNKEN,
+            bd=3,
+            scrollregion=(0, 0, 2000, 2000)
+        )
+        
+        h_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        v_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        
+        self.renderer = TreeRenderer(self.canvas, NodeStyle(), h_scrollbar, v_scrollbar)
+        
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    
+    def build_tree(self):
+        values_str = self.values_entry.get().strip()
+        if not values_str:
+            messagebox.showwarning("Warning", "Please enter some values!")
+            return
+        
+        tree_type = self.tree_type_var.get()
+        parse_value = self.parse_value
+        
+        def job(task):
+            # Runs on a worker thread: build into a fresh tree, not the shown one
+            parts = values_str.split(",")
+            values = [parse_value(x.strip())
+                      for x in task.iterate(parts, len(parts), "Reading values...")]
+            tree = AVLTree() if tree_type == "Create AVL Tree" else BinarySearchTree()
+            task.progress(None, f"Building {len(values)} nodes...")
+            root = tree.build(values)
+            task.progress(None, "Laying out...")
+            return tree, root, tidy_layout(root)
+        
+        def done(result):
+            tree, root, layout = result
+            self.tree_root = root
+            if tree_type == "Create AVL Tree":
+                self.tree_type = "AVL"
+                self.avl = tree
+            else:
+                self.tree_type = "BST"
+                self.bst = tree
+            self.draw_tree(layout=layout)
+            messagebox.showinfo("Success", f"{tree_type} created successfully!")
+        
+        def error(e):
+            if isinstance(e, ValueError):
+                messagebox.showerror("Error", "Please enter valid comma-separated numbers!")
+            else:
+                messagebox.showerror("Error", str(e))
+        
+        self.tasks.run(job, done, error, "Building tree...")
+    
+    def delete_node(self):
+        if not self.tree_root:
+            messagebox.showwarning("Warning", "Please create a tree first!")
+            return
+        
+        try:
+            value = self.parse_value(self.delete_entry.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number to delete!")
+            return
+        
+        tree = self.avl if self.tree_type == "AVL" else self.bst
+        shown = self.tree_root
+        
+        def job(task):
+            # The shown tree is still being drawn, so delete from a copy
+            root = tree.delete(tree.copy(shown), value)
+            task.progress(None, "Laying out...")
+            return root, tidy_layout(root)
+        
+        def done(result):
+            self.tree_root, layout = result
+            self.draw_tree(update=True, layout=layout)
+            self.delete_entry.delete(0, tk.END)
+            messagebox.showinfo("Success", f"Node {value} deleted successfully!")
+        
+        self.tasks.run(job, done, message=f"Deleting {value}...")
+    
+    def draw_tree(self, update=False, layout=None):
+        self.canvas.delete("message")
+        
+        if not self.tree_root:
+            self.renderer.clear()
+            self.canvas.create_text(
+                500, 300,
+                text="Tree is empty!",
+                font=("Arial", 24, "bold"),
+                fill="#95a5a6",
+                tags="message"
+            )
+            return
+        
+        if update:
+            # A copy of the shown tree minus one node: match nodes by key
+            # so only what the delete moved is redrawn
+            self.renderer.update(self.tree_root, layout=layout, key=attrgetter("key"))
+        else:
+            self.renderer.show(self.tree_root, layout=layout)
+
+def main():
+    root = tk.Tk()
+    app = TreeMakerApp(root)
+    root.mainloop()
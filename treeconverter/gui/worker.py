@@ -0,0 +1,167 @@
+"""Running slow tree work off the Tk main loop.
+
+A ``BackgroundTask`` runs a job on a daemon thread. The job reports
+progress and its result through a queue that the main loop polls with
+``after``, so Tk is only ever touched from its own thread. Cancelling
+sets a flag that the job sees the next time it reports progress; the
+window is free again at once and a late result is thrown away.
+
+The job must not share mutable state with the main thread while it runs:
+build into a fresh tree and hand it over in ``on_done``.
+"""
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+class Cancelled(Exception):
+    pass
+
+class BackgroundTask:
+    poll_ms = 50
+    # iterate() reports progress once per this many items
+    chunk = 4096
+
+    def __init__(self, widget, job, on_done=None, on_error=None, on_progress=None):
+        self.widget = widget  # any widget; only its after() is used
+        self.job = job
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._queue = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._poll_id = None
+
+    def start(self):
+        self._thread.start()
+        self._poll_id = self.widget.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+        if self._poll_id is not None:
+            self.widget.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def running(self):
+        return self._poll_id is not None
+
+    # Called from the worker thread
+
+    def progress(self, fraction=None, message=None):
+        """Report progress (fraction in [0, 1], or None if unknown); raises Cancelled."""
+        if self._cancel.is_set():
+            raise Cancelled()
+        self._queue.put(("progress", fraction, message))
+
+    def iterate(self, items, total=None, message=None):
+        """Yield items, reporting progress every ``chunk`` of them."""
+        for i, item in enumerate(items):
+            if not i % self.chunk:
+                self.progress(i / total if total else None, message)
+            yield item
+
+    def _run(self):
+        try:
+            result = self.job(self)
+        except Cancelled:
+            return
+        except Exception as e:
+            self._queue.put(("error", e))
+        else:
+            self._queue.put(("done", result))
+
+    # Called from the main loop
+
+    def _poll(self):
+        self._poll_id = None
+        last = None
+        while True:
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                last = message  # only the newest one is worth drawing
+                continue
+            if message[0] == "done":
+                if self.on_done is not None:
+                    self.on_done(message[1])
+            elif self.on_error is not None:
+                self.on_error(message[1])
+            return
+        if last is not None and self.on_progress is not None:
+            self.on_progress(last[1], last[2])
+        self._poll_id = self.widget.after(self.poll_ms, self._poll)
+
+class TaskPanel(tk.Frame):
+    """Status line, progress bar and Cancel button for one app's background work.
+
+    Only one task runs at a time; starting another cancels the current one.
+    """
+    poll_ms = 50
+
+    def __init__(self, parent, bg=None, fg=None, **options):
+        super().__init__(parent, bg=bg, **options)
+        self.task = None
+        self.status = tk.Label(self, text="Ready", anchor="w", bg=bg, fg=fg)
+        self.status.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_button = tk.Button(self, text="Cancel", state=tk.DISABLED,
+                                       command=self.cancel)
+        self.cancel_button.pack(side=tk.RIGHT, padx=(10, 0))
+        self.bar = ttk.Progressbar(self, length=200, maximum=100)
+        self.bar.pack(side=tk.RIGHT)
+
+    def run(self, job, on_done, on_error=None, message="Working..."):
+        """Run job(task) in the background and pass its result to on_done."""
+        self.cancel()
+        self._show(None, message)
+        self.cancel_button.configure(state=tk.NORMAL)
+
+        def done(result):
+            self._finish("Ready")
+            on_done(result)
+
+        def error(e):
+            self._finish("Failed")
+            (on_error or self.show_error)(e)
+
+        self.task = BackgroundTask(self, job, done, error, self._show).start()
+        return self.task
+
+    def cancel(self):
+        if self.task is not None and self.task.running:
+            self.task.cancel()
+            self._finish("Cancelled")
+
+    @property
+    def busy(self):
+        return self.task is not None and self.task.running
+
+    def show_error(self, e):
+        messagebox.showerror("Error", str(e))
+
+    def _show(self, fraction, message):
+        if message is not None:
+            self.status.configure(text=message)
+        if fraction is None:
+            # Unknown length: let Tk keep the bar moving on its own
+            if str(self.bar.cget("mode")) != "indeterminate":
+                self.bar.configure(mode="indeterminate")
+                self.bar.start(self.poll_ms)
+        else:
+            self.bar.stop()
+            self.bar.configure(mode="determinate", value=100 * fraction)
+
+    def _finish(self, message):
+        self.task = None
+        self.status.configure(text=message)
+        self.bar.stop()
+        self.bar.configure(mode="determinate", value=0)
+        self.cancel_button.configure(state=tk.DISABLED)
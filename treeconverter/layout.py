@@ -0,0 +1,155 @@
+"""Tidy (Reingold-Tilford) layout for binary trees.
+
+Each subtree is laid out on its own, then the two subtrees of a node are
+pushed together until their facing contours are exactly ``sep`` apart at
+the closest depth, and the parent is centered above them. A lone child
+sits ``sep / 2`` to its side, so left and right stay distinguishable.
+
+A contour is kept as two per-depth lists (leftmost and rightmost x) stored
+deepest level first, with a lazy shift, so a parent reuses its taller
+child's lists and only touches the depths both children share. Summed over
+the tree that is O(n), and no recursion is needed, so degenerate trees
+thousands of levels deep lay out fine.
+
+Coordinates are in units of ``sep``; the drawing code scales them.
+"""
+from bisect import bisect_left, bisect_right
+
+class TreeLayout:
+    """Node positions in level order.
+
+    ``nodes[i]`` is drawn at (``x[i]``, depth), ``parent[i]`` is the index
+    of its parent (-1 for the root), and the nodes of depth d are
+    ``level_starts[d]:level_starts[d + 1]``, left to right, so ``x`` is
+    sorted within each level.
+    """
+
+    def __init__(self, nodes, x, parent, level_starts):
+        self.nodes = nodes
+        self.x = x
+        self.parent = parent
+        self.level_starts = level_starts
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def width(self):
+        return max(self.x) if self.x else 0
+
+    @property
+    def height(self):
+        return len(self.level_starts) - 1
+
+    def depth(self, i):
+        return bisect_right(self.level_starts, i) - 1
+
+    def find(self, node, key=None):
+        """Position of node in nodes, or -1; nodes near the root are found quickly.
+
+        With ``key``, find the node with the same key(node) instead.
+        """
+        if key is None:
+            for i, other in enumerate(self.nodes):
+                if other is node:
+                    return i
+            return -1
+        target = key(node)
+        for i, other in enumerate(self.nodes):
+            if key(other) == target:
+                return i
+        return -1
+
+    def index(self):
+        # node -> position in nodes, for callers that look nodes up by identity
+        return {id(node): i for i, node in enumerate(self.nodes)}
+
+    def visible(self, depth, x_lo, x_hi):
+        """Index range of the nodes at ``depth`` whose x lies in [x_lo, x_hi]."""
+        lo, hi = self.level_starts[depth], self.level_starts[depth + 1]
+        return (bisect_left(self.x, x_lo, lo, hi), bisect_right(self.x, x_hi, lo, hi))
+
+def tidy_layout(root, nil=None, sep=1.0):
+    """Lay out the tree under ``root``; ``nil`` is the leaf sentinel, if any."""
+    if root is None or root is nil:
+        return TreeLayout([], [], [], [0])
+
+    # Level order: children always come after their parent
+    nodes = [root]
+    parent = [-1]
+    level_starts = [0]
+    n = 1
+    child_l = []
+    child_r = []
+    lo = 0
+    while lo < n:
+        for i in range(lo, n):
+            node = nodes[i]
+            child = node.left
+            if child is not None and child is not nil:
+                child_l.append(len(nodes))
+                nodes.append(child)
+                parent.append(i)
+            else:
+                child_l.append(-1)
+            child = node.right
+            if child is not None and child is not nil:
+                child_r.append(len(nodes))
+                nodes.append(child)
+                parent.append(i)
+            else:
+                child_r.append(-1)
+        lo, n = n, len(nodes)
+        level_starts.append(lo)
+
+    offset = [0.0] * n  # x relative to the parent
+    contour = [None] * n  # (lefts, rights, shift) until the parent takes it
+    half = sep / 2
+    for i in range(n - 1, -1, -1):
+        left, right = child_l[i], child_r[i]
+        if left < 0 and right < 0:
+            contour[i] = ([0.0], [0.0], 0.0)
+            continue
+        if left < 0 or right < 0:
+            child = left if left >= 0 else right
+            lefts, rights, shift = contour[child]
+            contour[child] = None
+            offset[child] = -half if child == left else half
+            shift += offset[child]
+        else:
+            ll, lr, ls = contour[left]
+            rl, rr, rs = contour[right]
+            contour[left] = contour[right] = None
+            nl, nr = len(ll), len(rl)
+            # Closest approach over the depths both subtrees reach
+            gap = sep
+            for k in range(1, min(nl, nr) + 1):
+                need = (lr[nl - k] + ls) - (rl[nr - k] + rs) + sep
+                if need > gap:
+                    gap = need
+            offset[left], offset[right] = -gap / 2, gap / 2
+            ls -= gap / 2
+            rs += gap / 2
+            # Keep the taller child's lists; at the depths both reach, the
+            # left child owns the left edge and the right child the right one
+            if nl >= nr:
+                lefts, rights, shift = ll, lr, ls
+                edge, short, delta, m = rights, rr, rs - ls, nr
+            else:
+                lefts, rights, shift = rl, rr, rs
+                edge, short, delta, m = lefts, ll, ls - rs, nl
+            nt = len(edge)
+            for k in range(1, m + 1):
+                edge[nt - k] = short[m - k] + delta
+        lefts.append(-shift)
+        rights.append(-shift)
+        contour[i] = (lefts, rights, shift)
+
+    # Absolute positions, shifted so the leftmost node sits at 0
+    x = [0.0] * n
+    for i in range(1, n):
+        x[i] = x[parent[i]] + offset[i]
+    lefts, _, shift = contour[0]
+    leftmost = min(lefts) + shift
+    x = [v - leftmost for v in x]
+    return TreeLayout(nodes, x, parent, level_starts)
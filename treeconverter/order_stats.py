@@ -0,0 +1,54 @@
+"""Rank/select queries over trees whose nodes carry a subtree ``size``.
+
+The functions work for both tree.py-style trees (``None`` children) and
+RedBlackTree (pass its ``NIL`` sentinel, whose size is 0).
+"""
+
+def subtree_size(node):
+    return node.size if node is not None else 0
+
+def fill_sizes(root, nil=None):
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if node is None or node is nil:
+            continue
+        if children_done:
+            node.size = 1 + subtree_size(node.left) + subtree_size(node.right)
+        else:
+            stack.append((node, True))
+            stack.append((node.left, False))
+            stack.append((node.right, False))
+
+def select(root, k):
+    """Return the data of the k-th smallest key (0-based)."""
+    if not 0 <= k < subtree_size(root):
+        raise IndexError("select index out of range")
+    node = root
+    while True:
+        left_size = subtree_size(node.left)
+        if k < left_size:
+            node = node.left
+        elif k > left_size:
+            k -= left_size + 1
+            node = node.right
+        else:
+            return node.data
+
+def rank(root, key, nil=None, inclusive=False):
+    """Return how many keys are smaller than ``key`` (or equal, if inclusive)."""
+    count = 0
+    node = root
+    while node is not None and node is not nil:
+        if key < node.key or (key == node.key and not inclusive):
+            node = node.left
+        else:
+            count += subtree_size(node.left) + 1
+            node = node.right
+    return count
+
+def count_range(root, lo, hi, nil=None):
+    """Return how many keys fall in the closed interval [lo, hi]."""
+    if hi < lo:
+        return 0
+    return rank(root, hi, nil, inclusive=True) - rank(root, lo, nil)
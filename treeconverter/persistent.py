@@ -0,0 +1,318 @@
+"""Persistent (immutable) AVL and red-black trees.
+
+Every update copies only the nodes on the search path and returns a new
+tree that shares all other subtrees with the old one, so an update costs
+O(log n) time and memory and keeping a snapshot is just keeping a
+reference. Nodes reachable from a published tree are never modified.
+
+Red-black insert follows Okasaki's balance; delete follows Kahrs'
+"Red-black trees with types" (balLeft/balRight/fuse).
+"""
+from treeconverter import setops
+from treeconverter.tree import BULK_LOAD_THRESHOLD, Node, build_balanced, irange
+
+class _PersistentTree:
+    def __init__(self, key=None, root=None, size=0):
+        self.key = key
+        self.root = root
+        self.size = size
+
+    def _replace(self, root, size):
+        return type(self)(self.key, root, size)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return irange(self.root)
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        return irange(self.root, lo, hi, reverse)
+
+    def search_node(self, key):
+        node = self.root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def contains(self, data):
+        return self.search_node(data if self.key is None else self.key(data)) is not None
+
+    __contains__ = contains
+
+    def get(self, data, default=None):
+        node = self.search_node(data if self.key is None else self.key(data))
+        return default if node is None else node.data
+
+    def insert(self, data):
+        """Return a tree that also holds data (self, if its key is present)."""
+        key = data if self.key is None else self.key(data)
+        root = self._insert(self.root, data, key)
+        if root is self.root:
+            return self
+        return self._replace(self._finish(root), self.size + 1)
+
+    def delete(self, data):
+        """Return a tree without data's key (self, if it is absent)."""
+        key = data if self.key is None else self.key(data)
+        if self.search_node(key) is None:
+            return self
+        return self._replace(self._finish(self._delete(self.root, key)), self.size - 1)
+
+    def update(self, values):
+        tree = self
+        for val in values:
+            tree = tree.insert(val)
+        return tree
+
+    def build(self, values):
+        """Return a new tree of values, with this tree's key function."""
+        values = list(values)
+        empty = self._replace(None, 0)
+        if len(values) < BULK_LOAD_THRESHOLD:
+            return empty.update(values)
+        entries = setops.sorted_unique(values, self.key)
+        return self._replace(self._load_sorted(entries, self.key is not None), len(entries))
+
+    def _finish(self, root):
+        return root
+
+# AVL
+
+def _height(node):
+    return node.height if node else 0
+
+def _copy(template, left, right):
+    # New node with template's data and key and the given children
+    node = Node(template.data, template.key)
+    node.left = left
+    node.right = right
+    hl, hr = _height(left), _height(right)
+    node.height = 1 + (hl if hl > hr else hr)
+    return node
+
+def _avl_balance(template, left, right):
+    hl, hr = _height(left), _height(right)
+    if hl > hr + 1:
+        if _height(left.left) < _height(left.right):
+            lr = left.right
+            return _copy(lr, _copy(left, left.left, lr.left), _copy(template, lr.right, right))
+        return _copy(left, left.left, _copy(template, left.right, right))
+    if hr > hl + 1:
+        if _height(right.right) < _height(right.left):
+            rl = right.left
+            return _copy(rl, _copy(template, left, rl.left), _copy(right, rl.right, right.right))
+        return _copy(right, _copy(template, left, right.left), right.right)
+    return _copy(template, left, right)
+
+def _avl_insert(node, data, key):
+    if not node:
+        return Node(data, key)
+    if key < node.key:
+        left = _avl_insert(node.left, data, key)
+        return node if left is node.left else _avl_balance(node, left, node.right)
+    if key > node.key:
+        right = _avl_insert(node.right, data, key)
+        return node if right is node.right else _avl_balance(node, node.left, right)
+    return node
+
+def _avl_delete_min(node):
+    # Returns (rest, minimum node)
+    if not node.left:
+        return node.right, node
+    left, minimum = _avl_delete_min(node.left)
+    return _avl_balance(node, left, node.right), minimum
+
+def _avl_delete(node, key):
+    if key < node.key:
+        return _avl_balance(node, _avl_delete(node.left, key), node.right)
+    if key > node.key:
+        return _avl_balance(node, node.left, _avl_delete(node.right, key))
+    if not node.left:
+        return node.right
+    if not node.right:
+        return node.left
+    right, successor = _avl_delete_min(node.right)
+    return _avl_balance(successor, node.left, right)
+
+class PersistentAVLTree(_PersistentTree):
+    """Immutable AVL tree; insert and delete return a new tree.
+
+    ``key`` works as for AVLTree.
+    """
+
+    def _insert(self, node, data, key):
+        return _avl_insert(node, data, key)
+
+    def _delete(self, node, key):
+        return _avl_delete(node, key)
+
+    def _load_sorted(self, entries, keyed):
+        return build_balanced(entries, Node, keyed)
+
+# Red-black
+
+class RBNode:
+    __slots__ = ("data", "key", "left", "right", "red")
+
+    def __init__(self, data, key=None, red=True):
+        self.data = data
+        self.key = data if key is None else key
+        self.left = None
+        self.right = None
+        self.red = red
+
+    @property
+    def color(self):
+        return "RED" if self.red else "BLACK"
+
+def _node(red, left, template, right):
+    node = RBNode(template.data, template.key, red)
+    node.left = left
+    node.right = right
+    return node
+
+def _is_red(node):
+    return node is not None and node.red
+
+def _black(node):
+    return _node(False, node.left, node, node.right) if node.red else node
+
+def _sub1(node):
+    # Kahrs' sub1: drop one black level from a black node
+    return _node(True, node.left, node, node.right)
+
+def _balance(left, template, right):
+    # Black node over left/right, rotating away a red-red pair below it
+    if _is_red(left) and _is_red(right):
+        return _node(True, _black(left), template, _black(right))
+    if _is_red(left):
+        if _is_red(left.left):
+            return _node(True, _black(left.left), left,
+                         _node(False, left.right, template, right))
+        if _is_red(left.right):
+            lr = left.right
+            return _node(True, _node(False, left.left, left, lr.left), lr,
+                         _node(False, lr.right, template, right))
+    if _is_red(right):
+        if _is_red(right.right):
+            return _node(True, _node(False, left, template, right.left), right,
+                         _black(right.right))
+        if _is_red(right.left):
+            rl = right.left
+            return _node(True, _node(False, left, template, rl.left), rl,
+                         _node(False, rl.right, right, right.right))
+    return _node(False, left, template, right)
+
+def _rb_insert(node, data, key):
+    if node is None:
+        return RBNode(data, key)
+    if key < node.key:
+        left = _rb_insert(node.left, data, key)
+        if left is node.left:
+            return node
+        if node.red:
+            return _node(True, left, node, node.right)
+        return _balance(left, node, node.right)
+    if key > node.key:
+        right = _rb_insert(node.right, data, key)
+        if right is node.right:
+            return node
+        if node.red:
+            return _node(True, node.left, node, right)
+        return _balance(node.left, node, right)
+    return node
+
+def _bal_left(left, template, right):
+    # left lost one black level during a delete
+    if _is_red(left):
+        return _node(True, _black(left), template, right)
+    if not right.red:
+        return _balance(left, template, _sub1(right))
+    rl = right.left
+    return _node(True, _node(False, left, template, rl.left), rl,
+                 _balance(rl.right, right, _sub1(right.right)))
+
+def _bal_right(left, template, right):
+    # right lost one black level during a delete
+    if _is_red(right):
+        return _node(True, left, template, _black(right))
+    if not left.red:
+        return _balance(_sub1(left), template, right)
+    lr = left.right
+    return _node(True, _balance(_sub1(left.left), left, lr.left), lr,
+                 _node(False, lr.right, template, right))
+
+def _fuse(left, right):
+    # Join two subtrees of equal black height whose parent is being removed
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if not left.red and right.red:
+        return _node(True, _fuse(left, right.left), right, right.right)
+    if left.red and not right.red:
+        return _node(True, left.left, left, _fuse(left.right, right))
+    middle = _fuse(left.right, right.left)
+    if left.red:
+        if _is_red(middle):
+            return _node(True, _node(True, left.left, left, middle.left), middle,
+                         _node(True, middle.right, right, right.right))
+        return _node(True, left.left, left, _node(True, middle, right, right.right))
+    if _is_red(middle):
+        return _node(True, _node(False, left.left, left, middle.left), middle,
+                     _node(False, middle.right, right, right.right))
+    return _bal_left(left.left, left, _node(False, middle, right, right.right))
+
+def _rb_delete(node, key):
+    if key < node.key:
+        left = _rb_delete(node.left, key)
+        if node.left.red:
+            return _node(True, left, node, node.right)
+        return _bal_left(left, node, node.right)
+    if key > node.key:
+        right = _rb_delete(node.right, key)
+        if node.right.red:
+            return _node(True, node.left, node, right)
+        return _bal_right(node.left, node, right)
+    return _fuse(node.left, node.right)
+
+class PersistentRedBlackTree(_PersistentTree):
+    """Immutable red-black tree; insert and delete return a new tree.
+
+    Nodes have no parent pointers, since a shared subtree can have many
+    parents. ``key`` works as for RedBlackTree.
+    """
+
+    def _insert(self, node, data, key):
+        return _rb_insert(node, data, key)
+
+    def _delete(self, node, key):
+        return _rb_delete(node, key)
+
+    def _finish(self, root):
+        return _black(root) if root is not None else None
+
+    def _load_sorted(self, entries, keyed):
+        # Same coloring as RedBlackTree.load_sorted: only a partial last level is red
+        red_depth = (len(entries) + 1).bit_length() - 1
+
+        def build(lo, hi, depth):
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            if keyed:
+                key, data = entries[mid]
+                node = RBNode(data, key, depth == red_depth)
+            else:
+                node = RBNode(entries[mid], None, depth == red_depth)
+            node.left = build(lo, mid - 1, depth + 1)
+            node.right = build(mid + 1, hi, depth + 1)
+            return node
+
+        return build(0, len(entries) - 1, 0)
@@ -0,0 +1,778 @@
+from treeconverter import order_stats, setops
+from treeconverter.tree import BULK_LOAD_THRESHOLD
+
+class Node:
+    # Color is kept as a bool; ``color`` stays available as "RED"/"BLACK"
+    # for the drawing code and other callers of the old API.
+    __slots__ = ("data", "key", "left", "right", "parent", "red")
+
+    def __init__(self, data, key=None):
+        self.data = data
+        self.key = data if key is None else key
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.red = True  # New nodes are always RED
+    
+    @property
+    def color(self):
+        return "RED" if self.red else "BLACK"
+    
+    @color.setter
+    def color(self, value):
+        self.red = value == "RED"
+
+class RedBlackTree:
+    """Red-black tree with parent pointers and a per-tree NIL sentinel.
+
+    ``key`` works like the key argument of sorted(): nodes are ordered by
+    key(data), computed once per node. insert/delete/contains/get take
+    data; range bounds, cursor positions and rank take keys. Without a key
+    function data is compared directly.
+    """
+    node_class = Node
+
+    def __init__(self, key=None):
+        self.key = key
+        self.NIL = self.node_class(None)
+        self.NIL.red = False
+        self.root = self.NIL
+    
+    def left_rotate(self, x):
+        y = x.right
+        x.right = y.left
+        
+        if y.left is not self.NIL:
+            y.left.parent = x
+        
+        y.parent = x.parent
+        
+        if x.parent is None:
+            self.root = y
+        elif x is x.parent.left:
+            x.parent.left = y
+        else:
+            x.parent.right = y
+        
+        y.left = x
+        x.parent = y
+    
+    def right_rotate(self, x):
+        y = x.left
+        x.left = y.right
+        
+        if y.right is not self.NIL:
+            y.right.parent = x
+        
+        y.parent = x.parent
+        
+        if x.parent is None:
+            self.root = y
+        elif x is x.parent.right:
+            x.parent.right = y
+        else:
+            x.parent.left = y
+        
+        y.right = x
+        x.parent = y
+    
+    def insert(self, data):
+        self._insert(data, data if self.key is None else self.key(data))
+    
+    def _insert(self, data, key):
+        parent = None
+        current = self.root
+        
+        while current is not self.NIL:
+            parent = current
+            if key < current.key:
+                current = current.left
+            elif key > current.key:
+                current = current.right
+            else:
+                return  # Duplicate value
+        
+        node = self.node_class(data, key)
+        node.left = self.NIL
+        node.right = self.NIL
+        node.parent = parent
+        
+        if parent is None:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        
+        node.red = True
+        self.insert_fixup(node)
+    
+    def load_sorted(self, keys):
+        # keys as for tree.BulkLoadMixin.load_sorted. A midpoint split fills
+        # every level except possibly the last one; coloring just that
+        # partial level red keeps every path equally black.
+        red_depth = (len(keys) + 1).bit_length() - 1
+        keyed = self.key is not None
+        
+        def build(lo, hi, parent, depth):
+            if lo > hi:
+                return self.NIL
+            mid = (lo + hi) // 2
+            if keyed:
+                key, data = keys[mid]
+                node = self.node_class(data, key)
+            else:
+                node = self.node_class(keys[mid])
+            node.parent = parent
+            node.red = depth == red_depth
+            node.left = build(lo, mid - 1, node, depth + 1)
+            node.right = build(mid + 1, hi, node, depth + 1)
+            return node
+        
+        self.root = build(0, len(keys) - 1, None, 0)
+    
+    def bulk_load(self, values):
+        self.load_sorted(setops.sorted_unique(values, self.key))
+    
+    def build(self, values):
+        values = list(values)
+        if len(values) >= BULK_LOAD_THRESHOLD:
+            self.bulk_load(values)
+            return
+        for val in values:
+            self.insert(val)
+    
+    def copy(self):
+        # A new tree with the same shape and colors; data itself is shared
+        other = type(self)(self.key)
+        if self.root is self.NIL:
+            return other
+        nil, node_class = other.NIL, self.node_class
+        
+        def clone(n, parent):
+            c = node_class(n.data, n.key)
+            c.red = n.red
+            c.parent = parent
+            c.left = c.right = nil
+            return c
+        
+        other.root = clone(self.root, None)
+        stack = [(self.root, other.root)]
+        while stack:
+            n, c = stack.pop()
+            if n.left is not self.NIL:
+                c.left = clone(n.left, c)
+                stack.append((n.left, c.left))
+            if n.right is not self.NIL:
+                c.right = clone(n.right, c)
+                stack.append((n.right, c.right))
+        return other
+    
+    def estimate_size(self):
+        # A red-black tree of black height h holds between 2**h - 1 and 4**h keys
+        return 2 ** (self.black_height(self.root) + 1) - 1 if self.root is not self.NIL else 0
+    
+    def entries(self):
+        # Inorder contents in the form load_sorted and setops.merge_sorted take
+        if self.key is None:
+            return list(self.irange())
+        return [(n.key, n.data) for n in self.irange_nodes()]
+    
+    def _merge(self, op, batch):
+        self.load_sorted(setops.merge_sorted(op, self.entries(), batch, self.key is not None))
+    
+    def insert_many(self, values):
+        batch = setops.sorted_unique(values, self.key)
+        if not batch:
+            return
+        if setops.prefer_rebuild(self.estimate_size(), len(batch)):
+            self._merge("union", batch)
+            return
+        if self.key is None:
+            for val in batch:
+                self._insert(val, val)
+        else:
+            for key, val in batch:
+                self._insert(val, key)
+    
+    def delete_many(self, values):
+        batch = setops.sorted_unique(values, self.key)
+        if not batch or self.root is self.NIL:
+            return
+        if setops.prefer_rebuild(self.estimate_size(), len(batch)):
+            self._merge("difference", batch)
+            return
+        for key in (batch if self.key is None else (k for k, _ in batch)):
+            self._delete(key)
+    
+    def black_height(self, node):
+        height = 0
+        while node is not self.NIL:
+            if not node.red:
+                height += 1
+            node = node.left
+        return height
+    
+    def _root_height(self, tree):
+        # Black height of tree once its root is blackened, as join does
+        if tree is self.NIL:
+            return 0
+        return self.black_height(tree) + (1 if tree.red else 0)
+    
+    def _child_height(self, child, height):
+        # The same for a child of a node of that (blackened) black height
+        if child is self.NIL:
+            return 0
+        return height if child.red else height - 1
+    
+    def join(self, left, node, right):
+        # Join two detached subtrees around node; every key in
+        # left < node.key < right. Returns the new (black) root.
+        return self._join(left, self._root_height(left), node,
+                          right, self._root_height(right))[0]
+    
+    def _join(self, left, bl, node, right, br):
+        # join with the black heights of left and right given, so the work
+        # is O(|bl - br| + 1); returns the root and its black height
+        for tree in (left, right):
+            if tree is not self.NIL:
+                tree.parent = None
+                tree.red = False
+        node.parent = None
+        
+        if bl == br:
+            node.left, node.right = left, right
+            if left is not self.NIL:
+                left.parent = node
+            if right is not self.NIL:
+                right.parent = node
+            node.red = False
+            return node, bl + 1
+        
+        # Hang node (RED) off the taller tree's inner spine at the first black
+        # node whose black height matches the shorter tree, then let
+        # insert_fixup repair any red-red pair on the way up.
+        if bl > br:
+            tall, target = left, br
+            spine = lambda n: n.right
+        else:
+            tall, target = right, bl
+            spine = lambda n: n.left
+        parent, current, height = None, tall, max(bl, br)
+        while current.red or height != target:
+            if not current.red:
+                height -= 1
+            # Track the parent ourselves: current may end up being NIL
+            parent, current = current, spine(current)
+        if bl > br:
+            node.left, node.right = current, right
+            parent.right = node
+        else:
+            node.left, node.right = left, current
+            parent.left = node
+        node.parent = parent
+        if node.left is not self.NIL:
+            node.left.parent = node
+        if node.right is not self.NIL:
+            node.right.parent = node
+        node.red = True
+        
+        saved_root = self.root
+        self.root = tall
+        grew = self.insert_fixup(node)
+        joined, self.root = self.root, saved_root
+        return joined, max(bl, br) + (1 if grew else 0)
+    
+    def split(self, node, key):
+        # Returns (left, found, right) with found None if key is absent
+        left, _, found, right, _ = self._split(node, key, self._root_height(node))
+        return left, found, right
+    
+    def _split(self, node, key, height):
+        # split with node's black height given; the two halves come back
+        # with theirs: (left, left height, found, right, right height)
+        if node is self.NIL:
+            return self.NIL, 0, None, self.NIL, 0
+        left, right = node.left, node.right
+        hl, hr = self._child_height(left, height), self._child_height(right, height)
+        node.left = node.right = self.NIL
+        if key == node.key:
+            return left, hl, node, right, hr
+        if key < node.key:
+            ll, hll, found, lr, hlr = self._split(left, key, hl)
+            return (ll, hll, found) + self._join(lr, hlr, node, right, hr)
+        rl, hrl, found, rr, hrr = self._split(right, key, hr)
+        return self._join(left, hl, node, rl, hrl) + (found, rr, hrr)
+    
+    def join2(self, left, right):
+        return self._join2(left, self._root_height(left), right, self._root_height(right))[0]
+    
+    def _join2(self, left, hl, right, hr):
+        if left is self.NIL:
+            return right, hr
+        rest, hrest, last, _, _ = self._split(left, self.maximum(left).key, hl)
+        return self._join(rest, hrest, last, right, hr)
+    
+    # The set operations below pass black heights down with the subtrees,
+    # so no join has to walk a spine to find them.
+    
+    def _union(self, a, ha, b, hb):
+        if a is self.NIL:
+            return b, hb
+        if b is self.NIL:
+            return a, ha
+        left, right = b.left, b.right
+        al, hal, _, ar, har = self._split(a, b.key, ha)
+        return self._join(*self._union(al, hal, left, self._child_height(left, hb)), b,
+                          *self._union(ar, har, right, self._child_height(right, hb)))
+    
+    def _intersection(self, a, ha, b, b_nil):
+        if a is self.NIL or b is b_nil:
+            return self.NIL, 0
+        al, hal, found, ar, har = self._split(a, b.key, ha)
+        left, hl = self._intersection(al, hal, b.left, b_nil)
+        right, hr = self._intersection(ar, har, b.right, b_nil)
+        if found:
+            return self._join(left, hl, found, right, hr)
+        return self._join2(left, hl, right, hr)
+    
+    def _difference(self, a, ha, b, b_nil):
+        if a is self.NIL or b is b_nil:
+            return a, ha
+        al, hal, _, ar, har = self._split(a, b.key, ha)
+        return self._join2(*self._difference(al, hal, b.left, b_nil),
+                           *self._difference(ar, har, b.right, b_nil))
+    
+    def _adopt(self, other):
+        # Point other's leaves at our NIL so its nodes can be linked in
+        stack = [other.root] if other.root is not other.NIL else []
+        while stack:
+            node = stack.pop()
+            for side in ("left", "right"):
+                child = getattr(node, side)
+                if child is other.NIL:
+                    setattr(node, side, self.NIL)
+                else:
+                    stack.append(child)
+        root = other.root if other.root is not other.NIL else self.NIL
+        other.root = other.NIL
+        return root
+    
+    def _finish(self, root):
+        self.root = root
+        if root is not self.NIL:
+            root.parent = None
+            root.red = False
+        self.NIL.parent = None
+    
+    def union(self, other, workers=None):
+        """Merge other into this tree, emptying other.
+        
+        other's nodes are relinked in O(len(other)), so pass the smaller
+        tree as other.
+        """
+        if workers and workers > 1:
+            self.load_sorted(setops.parallel_set_operation(
+                "union", self.entries(), other.entries(), workers, self.key is not None))
+            other.root = other.NIL
+            return
+        b = self._adopt(other)
+        self._finish(self._union(self.root, self._root_height(self.root),
+                                 b, self._root_height(b))[0])
+    
+    def intersection(self, other, workers=None):
+        # Keeps only keys also in other; other is left untouched
+        if workers and workers > 1:
+            self.load_sorted(setops.parallel_set_operation(
+                "intersection", self.entries(), other.entries(), workers, self.key is not None))
+            return
+        self._finish(self._intersection(self.root, self._root_height(self.root),
+                                        other.root, other.NIL)[0])
+    
+    def difference(self, other, workers=None):
+        # Removes every key found in other; other is left untouched
+        if workers and workers > 1:
+            self.load_sorted(setops.parallel_set_operation(
+                "difference", self.entries(), other.entries(), workers, self.key is not None))
+            return
+        self._finish(self._difference(self.root, self._root_height(self.root),
+                                      other.root, other.NIL)[0])
+    
+    def insert_fixup(self, node):
+        while node.parent is not None and node.parent.red:
+            if node.parent is node.parent.parent.left:
+                uncle = node.parent.parent.right
+                
+                if uncle.red:
+                    node.parent.red = False
+                    uncle.red = False
+                    node.parent.parent.red = True
+                    node = node.parent.parent
+                else:
+                    if node is node.parent.right:
+                        node = node.parent
+                        self.left_rotate(node)
+                    
+                    node.parent.red = False
+                    node.parent.parent.red = True
+                    self.right_rotate(node.parent.parent)
+            else:
+                uncle = node.parent.parent.left
+                
+                if uncle.red:
+                    node.parent.red = False
+                    uncle.red = False
+                    node.parent.parent.red = True
+                    node = node.parent.parent
+                else:
+                    if node is node.parent.left:
+                        node = node.parent
+                        self.right_rotate(node)
+                    
+                    node.parent.red = False
+                    node.parent.parent.red = True
+                    self.left_rotate(node.parent.parent)
+        
+        # Tells join whether the black height grew: the root was recolored
+        grew = self.root.red
+        self.root.red = False
+        return grew
+    
+    def transplant(self, u, v):
+        if u.parent is None:
+            self.root = v
+        elif u is u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        v.parent = u.parent
+    
+    def minimum(self, node):
+        while node.left is not self.NIL:
+            node = node.left
+        return node
+    
+    def maximum(self, node):
+        while node.right is not self.NIL:
+            node = node.right
+        return node
+    
+    def successor(self, node):
+        if node.right is not self.NIL:
+            return self.minimum(node.right)
+        parent = node.parent
+        while parent is not None and node is parent.right:
+            node = parent
+            parent = parent.parent
+        return parent if parent is not None else self.NIL
+    
+    def predecessor(self, node):
+        if node.left is not self.NIL:
+            return self.maximum(node.left)
+        parent = node.parent
+        while parent is not None and node is parent.left:
+            node = parent
+            parent = parent.parent
+        return parent if parent is not None else self.NIL
+    
+    def ceiling_node(self, key):
+        # Lowest node with a key >= the given one, or NIL
+        node = self.root
+        best = self.NIL
+        while node is not self.NIL:
+            if node.key < key:
+                node = node.right
+            else:
+                best = node
+                node = node.left
+        return best
+    
+    def floor_node(self, key):
+        # Highest node with a key <= the given one, or NIL
+        node = self.root
+        best = self.NIL
+        while node is not self.NIL:
+            if node.key > key:
+                node = node.left
+            else:
+                best = node
+                node = node.right
+        return best
+    
+    def irange_nodes(self, lo=None, hi=None, reverse=False):
+        # Follows parent pointers, so only O(1) extra memory is used.
+        # The tree must not be modified while the generator is running.
+        if self.root is self.NIL:
+            return
+        if not reverse:
+            node = self.minimum(self.root) if lo is None else self.ceiling_node(lo)
+            while node is not self.NIL and (hi is None or node.key <= hi):
+                yield node
+                node = self.successor(node)
+        else:
+            node = self.maximum(self.root) if hi is None else self.floor_node(hi)
+            while node is not self.NIL and (lo is None or node.key >= lo):
+                yield node
+                node = self.predecessor(node)
+    
+    def irange(self, lo=None, hi=None, reverse=False):
+        for node in self.irange_nodes(lo, hi, reverse):
+            yield node.data
+    
+    def cursor(self, key=None, reverse=False):
+        if self.root is self.NIL:
+            return Cursor(self, self.NIL)
+        if not reverse:
+            node = self.minimum(self.root) if key is None else self.ceiling_node(key)
+        else:
+            node = self.maximum(self.root) if key is None else self.floor_node(key)
+        return Cursor(self, node)
+    
+    def delete(self, data):
+        return self._delete(data if self.key is None else self.key(data))
+    
+    def _delete(self, key):
+        node = self.search_node(self.root, key)
+        
+        if node is self.NIL:
+            return False
+        
+        y = node
+        y_original_red = y.red
+        
+        if node.left is self.NIL:
+            x = node.right
+            self.transplant(node, node.right)
+        elif node.right is self.NIL:
+            x = node.left
+            self.transplant(node, node.left)
+        else:
+            y = self.minimum(node.right)
+            y_original_red = y.red
+            x = y.right
+            
+            if y.parent is node:
+                x.parent = y
+            else:
+                self.transplant(y, y.right)
+                y.right = node.right
+                y.right.parent = y
+            
+            self.transplant(node, y)
+            y.left = node.left
+            y.left.parent = y
+            y.red = node.red
+        
+        if not y_original_red:
+            self.delete_fixup(x)
+        
+        return True
+    
+    def delete_fixup(self, x):
+        while x is not self.root and not x.red:
+            if x is x.parent.left:
+                w = x.parent.right
+                
+                if w.red:
+                    w.red = False
+                    x.parent.red = True
+                    self.left_rotate(x.parent)
+                    w = x.parent.right
+                
+                if not w.left.red and not w.right.red:
+                    w.red = True
+                    x = x.parent
+                else:
+                    if not w.right.red:
+                        w.left.red = False
+                        w.red = True
+                        self.right_rotate(w)
+                        w = x.parent.right
+                    
+                    w.red = x.parent.red
+                    x.parent.red = False
+                    w.right.red = False
+                    self.left_rotate(x.parent)
+                    x = self.root
+            else:
+                w = x.parent.left
+                
+                if w.red:
+                    w.red = False
+                    x.parent.red = True
+                    self.right_rotate(x.parent)
+                    w = x.parent.left
+                
+                if not w.right.red and not w.left.red:
+                    w.red = True
+                    x = x.parent
+                else:
+                    if not w.left.red:
+                        w.right.red = False
+                        w.red = True
+                        self.left_rotate(w)
+                        w = x.parent.left
+                    
+                    w.red = x.parent.red
+                    x.parent.red = False
+                    w.left.red = False
+                    self.right_rotate(x.parent)
+                    x = self.root
+        
+        x.red = False
+    
+    def search_node(self, node, key):
+        nil = self.NIL
+        while node is not nil:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node
+        return node
+    
+    def contains(self, data):
+        key = data if self.key is None else self.key(data)
+        return self.search_node(self.root, key) is not self.NIL
+    
+    __contains__ = contains
+    
+    def get(self, data, default=None):
+        # Returns the stored data whose key matches data's, or default
+        key = data if self.key is None else self.key(data)
+        node = self.search_node(self.root, key)
+        return default if node is self.NIL else node.data
+
+class Cursor:
+    """Bidirectional position in a RedBlackTree.
+
+    Stepping past either end leaves the cursor invalid; stepping back from
+    there returns to the end node. A cursor is only good until the tree is
+    next modified.
+    """
+
+    def __init__(self, tree, node):
+        self.tree = tree
+        self.node = node
+        self.before = None  # node we stepped back from, when off the front
+        self.after = None  # node we stepped on from, when off the back
+    
+    @property
+    def valid(self):
+        return self.node is not self.tree.NIL
+    
+    @property
+    def key(self):
+        if not self.valid:
+            raise IndexError("cursor is not positioned on a node")
+        return self.node.key
+    
+    @property
+    def value(self):
+        if not self.valid:
+            raise IndexError("cursor is not positioned on a node")
+        return self.node.data
+    
+    def next(self):
+        if self.valid:
+            self.after = self.node
+            self.node = self.tree.successor(self.node)
+        elif self.before is not None:
+            self.node = self.before
+        self.before = None
+        return self.valid
+    
+    def prev(self):
+        if self.valid:
+            self.before = self.node
+            self.node = self.tree.predecessor(self.node)
+        elif self.after is not None:
+            self.node = self.after
+        self.after = None
+        return self.valid
+
+class SizedNode(Node):
+    __slots__ = ("size",)
+
+    def __init__(self, data, key=None):
+        super().__init__(data, key)
+        self.size = 1
+
+class OrderStatisticRedBlackTree(RedBlackTree):
+    """RedBlackTree that keeps subtree sizes for O(log n) rank/select."""
+    node_class = SizedNode
+
+    def __init__(self, key=None):
+        super().__init__(key)
+        self.NIL.size = 0
+    
+    def left_rotate(self, x):
+        y = x.right
+        super().left_rotate(x)
+        x.size = 1 + x.left.size + x.right.size
+        y.size = 1 + y.left.size + y.right.size
+    
+    def right_rotate(self, x):
+        y = x.left
+        super().right_rotate(x)
+        x.size = 1 + x.left.size + x.right.size
+        y.size = 1 + y.left.size + y.right.size
+    
+    def _insert(self, data, key):
+        node = self.root
+        path = []
+        while node is not self.NIL:
+            if key == node.key:
+                return  # Duplicate value
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        for n in path:
+            n.size += 1
+        super()._insert(data, key)
+    
+    def _delete(self, key):
+        node = self.root
+        path = []
+        while node is not self.NIL and key != node.key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is self.NIL:
+            return False
+        for n in path:
+            n.size -= 1
+        if node.left is not self.NIL and node.right is not self.NIL:
+            # The successor moves into node's place, one smaller than node was
+            y = node.right
+            while y is not self.NIL:
+                y.size -= 1
+                successor = y
+                y = y.left
+            successor.size = node.size - 1
+        return super()._delete(key)
+    
+    def load_sorted(self, keys):
+        super().load_sorted(keys)
+        order_stats.fill_sizes(self.root, self.NIL)
+    
+    def copy(self):
+        other = super().copy()
+        order_stats.fill_sizes(other.root, other.NIL)
+        return other
+    
+    def estimate_size(self):
+        return self.root.size
+    
+    def _finish(self, root):
+        # join/split don't track sizes, so recount once at the end
+        super()._finish(root)
+        order_stats.fill_sizes(self.root, self.NIL)
+    
+    def select(self, k):
+        return order_stats.select(self.root, k)
+    
+    def rank(self, key):
+        return order_stats.rank(self.root, key, self.NIL)
+    
+    def count_range(self, lo, hi):
+        return order_stats.count_range(self.root, lo, hi, self.NIL)
@@ -0,0 +1,224 @@
+"""Join-based set operations on AVL trees built from tree.Node.
+
+``join``/``split`` are the two primitives; union, intersection and
+difference are written on top of them and run in O(m log(n/m + 1)) for
+trees of sizes m <= n. All of these reuse (and so consume) the nodes of
+their input trees.
+
+For very large trees ``parallel_set_operation`` splits two sorted key
+sequences into ranges and merges the ranges in worker processes; the
+result is a sorted key list ready for ``load_sorted``. Trees with a key
+function pass (key, data) pairs instead and set ``keyed``.
+"""
+import os
+from bisect import bisect_left
+from operator import itemgetter
+
+def height(node):
+    return node.height if node else 0
+
+def _update(node):
+    hl, hr = height(node.left), height(node.right)
+    node.height = 1 + (hl if hl > hr else hr)
+
+def _make(left, node, right):
+    node.left = left
+    node.right = right
+    _update(node)
+    return node
+
+def _rotate_left(x):
+    y = x.right
+    x.right = y.left
+    _update(x)
+    y.left = x
+    _update(y)
+    return y
+
+def _rotate_right(y):
+    x = y.left
+    y.left = x.right
+    _update(y)
+    x.right = y
+    _update(x)
+    return x
+
+def _join_right(left, node, right):
+    c = left.right
+    if height(c) <= height(right) + 1:
+        middle = _make(c, node, right)
+        if height(middle) <= height(left.left) + 1:
+            return _make(left.left, left, middle)
+        return _rotate_left(_make(left.left, left, _rotate_right(middle)))
+    middle = _join_right(c, node, right)
+    joined = _make(left.left, left, middle)
+    if height(middle) <= height(left.left) + 1:
+        return joined
+    return _rotate_left(joined)
+
+def _join_left(left, node, right):
+    c = right.left
+    if height(c) <= height(left) + 1:
+        middle = _make(left, node, c)
+        if height(middle) <= height(right.right) + 1:
+            return _make(middle, right, right.right)
+        return _rotate_right(_make(_rotate_left(middle), right, right.right))
+    middle = _join_left(left, node, c)
+    joined = _make(middle, right, right.right)
+    if height(middle) <= height(right.right) + 1:
+        return joined
+    return _rotate_right(joined)
+
+def join(left, node, right):
+    """Join two AVL trees around ``node``; every key in left < node < right."""
+    hl, hr = height(left), height(right)
+    if hl > hr + 1:
+        return _join_right(left, node, right)
+    if hr > hl + 1:
+        return _join_left(left, node, right)
+    return _make(left, node, right)
+
+def split(root, key):
+    """Return (left, node, right): keys below key, key's node or None, keys above."""
+    if not root:
+        return None, None, None
+    left, right = root.left, root.right
+    if key == root.key:
+        root.left = root.right = None
+        root.height = 1
+        return left, root, right
+    if key < root.key:
+        ll, found, lr = split(left, key)
+        return ll, found, join(lr, root, right)
+    rl, found, rr = split(right, key)
+    return join(left, root, rl), found, rr
+
+def split_last(root):
+    """Return (rest, last): the tree without its maximum, and the maximum node."""
+    if not root.right:
+        left = root.left
+        root.left = None
+        root.height = 1
+        return left, root
+    rest, last = split_last(root.right)
+    return join(root.left, root, rest), last
+
+def join2(left, right):
+    if not left:
+        return right
+    rest, last = split_last(left)
+    return join(rest, last, right)
+
+def union(a, b):
+    if not a:
+        return b
+    if not b:
+        return a
+    left, right = b.left, b.right
+    al, _, ar = split(a, b.key)
+    return join(union(al, left), b, union(ar, right))
+
+def intersection(a, b):
+    if not a or not b:
+        return None
+    al, found, ar = split(a, b.key)
+    left = intersection(al, b.left)
+    right = intersection(ar, b.right)
+    if found:
+        return join(left, found, right)
+    return join2(left, right)
+
+def difference(a, b):
+    if not a:
+        return None
+    if not b:
+        return a
+    al, _, ar = split(a, b.key)
+    return join2(difference(al, b.left), difference(ar, b.right))
+
+# Calibrated on RedBlackTree: sorted per-key inserts break even with a
+# rebuild once the batch is roughly as large as the tree.
+REBUILD_COST = 8
+
+def prefer_rebuild(n, m):
+    """Whether applying m updates to an n-key tree is cheaper as a rebuild.
+
+    Per-key updates cost about m * log2(n + m) steps; merging the batch
+    into the inorder sequence and rebuilding costs about (n + m), with a
+    higher constant per element.
+    """
+    return m * max(1, (n + m).bit_length()) >= REBUILD_COST * (n + m)
+
+# Parallel divide-and-conquer over sorted key sequences
+
+def sorted_unique(values, key=None):
+    """Sort values for load_sorted, dropping duplicates.
+
+    With a key function, return (key, value) pairs ordered by key instead,
+    keeping the first value seen for each key; key is called once per value.
+    """
+    if key is None:
+        return sorted(set(values))
+    out = []
+    for pair in sorted(((key(v), v) for v in values), key=itemgetter(0)):
+        if not out or out[-1][0] < pair[0]:
+            out.append(pair)
+    return out
+
+def merge_sorted(op, a, b, keyed=False):
+    out = []
+    i = j = 0
+    na, nb = len(a), len(b)
+    while i < na and j < nb:
+        x, y = a[i], b[j]
+        kx, ky = (x[0], y[0]) if keyed else (x, y)
+        if kx < ky:
+            if op != "intersection":
+                out.append(x)
+            i += 1
+        elif ky < kx:
+            if op == "union":
+                out.append(y)
+            j += 1
+        else:
+            if op != "difference":
+                out.append(x)
+            i += 1
+            j += 1
+    if op != "intersection":
+        out.extend(a[i:])
+    if op == "union":
+        out.extend(b[j:])
+    return out
+
+def _merge_task(args):
+    return merge_sorted(*args)
+
+def parallel_set_operation(op, a, b, workers=None, keyed=False):
+    """Apply "union", "intersection" or "difference" to two sorted key lists.
+
+    Both lists are cut at the same pivot keys so each range can be merged
+    independently in its own process.
+    """
+    if op not in ("union", "intersection", "difference"):
+        raise ValueError(f"Unknown set operation: {op}")
+    a, b = list(a), list(b)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(a) + len(b) < 2 * workers:
+        return merge_sorted(op, a, b, keyed)
+    # Imported here: concurrent.futures would double the package's import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    keys_a = [k for k, _ in a] if keyed else a
+    keys_b = [k for k, _ in b] if keyed else b
+    longer = keys_a if len(a) >= len(b) else keys_b
+    pivots = [longer[len(longer) * i // workers] for i in range(1, workers)]
+    cuts_a = [0] + [bisect_left(keys_a, p) for p in pivots] + [len(a)]
+    cuts_b = [0] + [bisect_left(keys_b, p) for p in pivots] + [len(b)]
+    tasks = [(op, a[cuts_a[i]:cuts_a[i + 1]], b[cuts_b[i]:cuts_b[i + 1]], keyed)
+             for i in range(workers)]
+    out = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_merge_task, tasks):
+            out.extend(part)
+    return out
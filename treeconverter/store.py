@@ -0,0 +1,460 @@
+from array import array
+from collections import deque
+
+# Handle 0 is a shared black sentinel, like RedBlackTree.NIL, so "no child"
+# is simply a falsy handle and the fixup code never special-cases it.
+NIL = 0
+BLACK = 0
+RED = 1
+
+KINDS = ("bst", "avl", "rbt")
+
+class ArrayTree:
+    """Binary tree stored as parallel arrays indexed by integer handles.
+
+    ``kind`` selects the balancing scheme used by insert/delete: "bst"
+    (none), "avl" (``meta`` holds heights) or "rbt" (``meta`` holds colors).
+    Pass ``typecode`` (e.g. "q") to keep integer keys in an array as well;
+    otherwise keys live in a plain list.
+    """
+
+    def __init__(self, kind="bst", typecode=None):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown tree kind: {kind}")
+        self.kind = kind
+        self.typecode = typecode
+        self.keys = array(typecode, [0]) if typecode else [None]
+        self.left = array("q", [NIL])
+        self.right = array("q", [NIL])
+        self.parent = array("q", [NIL])
+        self.meta = array("b", [BLACK])
+        self.root = NIL
+        self.size = 0
+        self._free = []
+
+    def __len__(self):
+        return self.size
+
+    def nbytes(self):
+        total = 0
+        for arr in (self.left, self.right, self.parent, self.meta):
+            total += arr.itemsize * len(arr)
+        if self.typecode:
+            total += self.keys.itemsize * len(self.keys)
+        else:
+            total += 8 * len(self.keys)
+        return total
+
+    def new_node(self, key):
+        meta = RED if self.kind == "rbt" else 1
+        if self._free:
+            h = self._free.pop()
+            self.keys[h] = key
+            self.left[h] = self.right[h] = self.parent[h] = NIL
+            self.meta[h] = meta
+        else:
+            h = len(self.left)
+            self.keys.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.parent.append(NIL)
+            self.meta.append(meta)
+        self.size += 1
+        return h
+
+    def _release(self, h):
+        self.left[h] = self.right[h] = self.parent[h] = NIL
+        if not self.typecode:
+            self.keys[h] = None
+        self._free.append(h)
+        self.size -= 1
+
+    # Construction and conversion
+
+    @classmethod
+    def from_level_order(cls, values, typecode=None, convert=None):
+        tree = cls("bst", typecode)
+        tokens = iter(values)
+        first = next(tokens, None)
+        if first is None or first.lower() == 'null':
+            return tree
+        convert = convert or (lambda tok: tok)
+        tree.root = tree.new_node(convert(first))
+        queue = deque([tree.root])
+        while queue:
+            h = queue.popleft()
+            for side in (tree.left, tree.right):
+                val = next(tokens, None)
+                if val is None:
+                    return tree
+                if val.lower() != 'null':
+                    child = tree.new_node(convert(val))
+                    side[h] = child
+                    tree.parent[child] = h
+                    queue.append(child)
+        return tree
+
+    @classmethod
+    def from_nodes(cls, root, kind="bst", typecode=None, nil=None):
+        """Copy the tree under root; ``nil`` is its leaf sentinel, if any
+        (e.g. ``RedBlackTree.NIL``)."""
+        tree = cls(kind, typecode)
+        if root is None or root is nil:
+            return tree
+        is_rbt = kind == "rbt"
+        # Walk parent-first so every child's parent handle already exists
+        tree.root = tree.new_node(_node_key(root))
+        stack = [(root, tree.root)]
+        while stack:
+            node, h = stack.pop()
+            if is_rbt:
+                tree.meta[h] = RED if node.color == "RED" else BLACK
+            elif kind == "avl":
+                tree.meta[h] = node.height
+            for child, side in ((node.left, tree.left), (node.right, tree.right)):
+                if child is None or child is nil:
+                    continue
+                ch = tree.new_node(_node_key(child))
+                side[h] = ch
+                tree.parent[ch] = h
+                stack.append((child, ch))
+        return tree
+
+    def to_nodes(self, node_factory=None):
+        """Linked copy of the tree: tree.Node, or rbt.Node with its color
+        for "rbt" stores, so the drawing code can show it."""
+        if node_factory is None:
+            if self.kind == "rbt":
+                from treeconverter.rbt import Node
+            else:
+                from treeconverter.tree import Node
+            node_factory = Node
+        if not self.root:
+            return None
+        root = node_factory(self.keys[self.root])
+        stack = [(self.root, root)]
+        while stack:
+            h, node = stack.pop()
+            if self.kind == "avl" and hasattr(node, "height"):
+                node.height = self.meta[h]
+            elif self.kind == "rbt" and hasattr(node, "red"):
+                node.red = self.meta[h] == RED
+            if self.left[h]:
+                node.left = node_factory(self.keys[self.left[h]])
+                stack.append((self.left[h], node.left))
+            if self.right[h]:
+                node.right = node_factory(self.keys[self.right[h]])
+                stack.append((self.right[h], node.right))
+        return root
+
+    # Traversals
+
+    def inorder(self):
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        h = self.root
+        while stack or h:
+            while h:
+                stack.append(h)
+                h = left[h]
+            h = stack.pop()
+            yield keys[h]
+            h = right[h]
+
+    def preorder(self):
+        keys, left, right = self.keys, self.left, self.right
+        stack = [self.root] if self.root else []
+        while stack:
+            h = stack.pop()
+            yield keys[h]
+            if right[h]:
+                stack.append(right[h])
+            if left[h]:
+                stack.append(left[h])
+
+    def postorder(self):
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        last = NIL
+        h = self.root
+        while stack or h:
+            if h:
+                stack.append(h)
+                h = left[h]
+                continue
+            peek = stack[-1]
+            if right[peek] and last != right[peek]:
+                h = right[peek]
+            else:
+                yield keys[peek]
+                last = stack.pop()
+
+    def traverse(self, order):
+        orders = {"Inorder": self.inorder, "Preorder": self.preorder,
+                  "Postorder": self.postorder}
+        if order not in orders:
+            raise ValueError(f"Unknown traversal: {order}")
+        return orders[order]()
+
+    # Search tree operations
+
+    def search(self, key):
+        keys, left, right = self.keys, self.left, self.right
+        h = self.root
+        while h:
+            k = keys[h]
+            if key < k:
+                h = left[h]
+            elif key > k:
+                h = right[h]
+            else:
+                return h
+        return NIL
+
+    def __contains__(self, key):
+        return self.search(key) != NIL
+
+    def minimum(self, h):
+        left = self.left
+        while left[h]:
+            h = left[h]
+        return h
+
+    def _height(self, h):
+        return self.meta[h] if h else 0
+
+    def _update_height(self, h):
+        lh, rh = self._height(self.left[h]), self._height(self.right[h])
+        self.meta[h] = 1 + (lh if lh > rh else rh)
+
+    def left_rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        y = right[x]
+        right[x] = left[y]
+        if left[y]:
+            parent[left[y]] = x
+        p = parent[x]
+        parent[y] = p
+        if not p:
+            self.root = y
+        elif x == left[p]:
+            left[p] = y
+        else:
+            right[p] = y
+        left[y] = x
+        parent[x] = y
+        if self.kind == "avl":
+            self._update_height(x)
+            self._update_height(y)
+        return y
+
+    def right_rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        y = left[x]
+        left[x] = right[y]
+        if right[y]:
+            parent[right[y]] = x
+        p = parent[x]
+        parent[y] = p
+        if not p:
+            self.root = y
+        elif x == right[p]:
+            right[p] = y
+        else:
+            left[p] = y
+        right[y] = x
+        parent[x] = y
+        if self.kind == "avl":
+            self._update_height(x)
+            self._update_height(y)
+        return y
+
+    def insert(self, key):
+        keys, left, right = self.keys, self.left, self.right
+        p = NIL
+        h = self.root
+        while h:
+            p = h
+            k = keys[h]
+            if key < k:
+                h = left[h]
+            elif key > k:
+                h = right[h]
+            else:
+                return NIL  # Duplicate value
+        z = self.new_node(key)
+        self.parent[z] = p
+        if not p:
+            self.root = z
+        elif key < keys[p]:
+            left[p] = z
+        else:
+            right[p] = z
+        if self.kind == "avl":
+            self._avl_rebalance(p)
+        elif self.kind == "rbt":
+            self._insert_fixup(z)
+        return z
+
+    def _avl_rebalance(self, h):
+        left, right, parent = self.left, self.right, self.parent
+        while h:
+            self._update_height(h)
+            balance = self._height(left[h]) - self._height(right[h])
+            if balance > 1:
+                l = left[h]
+                if self._height(left[l]) < self._height(right[l]):
+                    self.left_rotate(l)
+                h = self.right_rotate(h)
+            elif balance < -1:
+                r = right[h]
+                if self._height(right[r]) < self._height(left[r]):
+                    self.right_rotate(r)
+                h = self.left_rotate(h)
+            h = parent[h]
+
+    def _insert_fixup(self, z):
+        left, right, parent, meta = self.left, self.right, self.parent, self.meta
+        while meta[parent[z]] == RED:
+            p = parent[z]
+            g = parent[p]
+            if p == left[g]:
+                uncle = right[g]
+                if meta[uncle] == RED:
+                    meta[p] = meta[uncle] = BLACK
+                    meta[g] = RED
+                    z = g
+                else:
+                    if z == right[p]:
+                        z = p
+                        self.left_rotate(z)
+                        p = parent[z]
+                    meta[p] = BLACK
+                    meta[g] = RED
+                    self.right_rotate(g)
+            else:
+                uncle = left[g]
+                if meta[uncle] == RED:
+                    meta[p] = meta[uncle] = BLACK
+                    meta[g] = RED
+                    z = g
+                else:
+                    if z == left[p]:
+                        z = p
+                        self.right_rotate(z)
+                        p = parent[z]
+                    meta[p] = BLACK
+                    meta[g] = RED
+                    self.left_rotate(g)
+        meta[self.root] = BLACK
+
+    def _transplant(self, u, v):
+        p = self.parent[u]
+        if not p:
+            self.root = v
+        elif u == self.left[p]:
+            self.left[p] = v
+        else:
+            self.right[p] = v
+        self.parent[v] = p
+
+    def delete(self, key):
+        z = self.search(key)
+        if not z:
+            return False
+        if self.kind == "rbt":
+            self._rbt_delete(z)
+            return True
+        left, right, parent = self.left, self.right, self.parent
+        if left[z] and right[z]:
+            y = self.minimum(right[z])
+            self.keys[z] = self.keys[y]
+            z = y
+        child = left[z] or right[z]
+        start = parent[z]
+        self._transplant(z, child)
+        self.parent[NIL] = NIL
+        self._release(z)
+        if self.kind == "avl":
+            self._avl_rebalance(start)
+        return True
+
+    def _rbt_delete(self, z):
+        left, right, parent, meta = self.left, self.right, self.parent, self.meta
+        y = z
+        y_original_color = meta[y]
+        if not left[z]:
+            x = right[z]
+            self._transplant(z, right[z])
+        elif not right[z]:
+            x = left[z]
+            self._transplant(z, left[z])
+        else:
+            y = self.minimum(right[z])
+            y_original_color = meta[y]
+            x = right[y]
+            if parent[y] == z:
+                parent[x] = y
+            else:
+                self._transplant(y, right[y])
+                right[y] = right[z]
+                parent[right[y]] = y
+            self._transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            meta[y] = meta[z]
+        if y_original_color == BLACK:
+            self._delete_fixup(x)
+        parent[NIL] = NIL
+        self._release(z)
+
+    def _delete_fixup(self, x):
+        left, right, parent, meta = self.left, self.right, self.parent, self.meta
+        while x != self.root and meta[x] == BLACK:
+            p = parent[x]
+            if x == left[p]:
+                w = right[p]
+                if meta[w] == RED:
+                    meta[w] = BLACK
+                    meta[p] = RED
+                    self.left_rotate(p)
+                    w = right[p]
+                if meta[left[w]] == BLACK and meta[right[w]] == BLACK:
+                    meta[w] = RED
+                    x = p
+                else:
+                    if meta[right[w]] == BLACK:
+                        meta[left[w]] = BLACK
+                        meta[w] = RED
+                        self.right_rotate(w)
+                        w = right[p]
+                    meta[w] = meta[p]
+                    meta[p] = BLACK
+                    meta[right[w]] = BLACK
+                    self.left_rotate(p)
+                    x = self.root
+            else:
+                w = left[p]
+                if meta[w] == RED:
+                    meta[w] = BLACK
+                    meta[p] = RED
+                    self.right_rotate(p)
+                    w = left[p]
+                if meta[right[w]] == BLACK and meta[left[w]] == BLACK:
+                    meta[w] = RED
+                    x = p
+                else:
+                    if meta[left[w]] == BLACK:
+                        meta[right[w]] = BLACK
+                        meta[w] = RED
+                        self.left_rotate(w)
+                        w = left[p]
+                    meta[w] = meta[p]
+                    meta[p] = BLACK
+                    meta[left[w]] = BLACK
+                    self.right_rotate(p)
+                    x = self.root
+        meta[x] = BLACK
+
+def _node_key(node):
+    return node.val if hasattr(node, "val") else node.data
@@ -0,0 +1,50 @@
+def inorder(root):
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.val
+        node = node.right
+
+def preorder(root):
+    if not root:
+        return
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node.val
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def postorder(root):
+    stack = []
+    last = None
+    node = root
+    while stack or node:
+        if node:
+            stack.append(node)
+            node = node.left
+            continue
+        peek = stack[-1]
+        # Descend right only if we have not just come back from it
+        if peek.right and last is not peek.right:
+            node = peek.right
+        else:
+            yield peek.val
+            last = stack.pop()
+
+TRAVERSALS = {
+    "Inorder": inorder,
+    "Preorder": preorder,
+    "Postorder": postorder,
+}
+
+def traverse(root, order):
+    if order not in TRAVERSALS:
+        raise ValueError(f"Unknown traversal: {order}")
+    return TRAVERSALS[order](root)
@@ -0,0 +1,542 @@
+from treeconverter import order_stats, setops
+
+class Node:
+    # ``key`` is what the tree orders by: data itself, or the result of the
+    # tree's key function, computed once when the node is created.
+    __slots__ = ("data", "key", "left", "right", "height")
+
+    def __init__(self, data, key=None):
+        self.data = data
+        self.key = data if key is None else key
+        self.left = None
+        self.right = None
+        self.height = 1
+
+# Below this many values build() inserts one by one, so small trees keep
+# the shape users expect from repeated inserts.
+BULK_LOAD_THRESHOLD = 1000
+
+def build_balanced(keys, node_class=Node, keyed=False):
+    """Build a height-balanced tree from sorted, duplicate-free keys in O(n).
+
+    With ``keyed`` the items are (key, data) pairs sorted by key.
+    """
+    def build(lo, hi):
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        if keyed:
+            key, data = keys[mid]
+            node = node_class(data, key)
+        else:
+            node = node_class(keys[mid])
+        node.left = build(lo, mid - 1)
+        node.right = build(mid + 1, hi)
+        node.height = 1 + max(node.left.height if node.left else 0,
+                              node.right.height if node.right else 0)
+        return node
+
+    return build(0, len(keys) - 1)
+
+def midpoint_order(items):
+    """Yield sorted items median first, then each half the same way.
+
+    Inserting them in this order into an unbalanced tree gives the same
+    shape as build_balanced instead of a chain.
+    """
+    stack = [(0, len(items) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if lo > hi:
+            continue
+        mid = (lo + hi) // 2
+        yield items[mid]
+        stack.append((mid + 1, hi))
+        stack.append((lo, mid - 1))
+
+def irange_nodes(node, lo=None, hi=None, reverse=False):
+    """Yield the nodes with keys in [lo, hi] in sorted (or reverse) order, lazily.
+
+    Nodes here have no parent pointers, so the walk keeps the O(h) stack of
+    pending ancestors; subtrees entirely outside the range are skipped.
+    """
+    stack = []
+    if not reverse:
+        while True:
+            while node:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and node.key > hi:
+                return
+            yield node
+            node = node.right
+    else:
+        while True:
+            while node:
+                if hi is not None and node.key > hi:
+                    node = node.left
+                else:
+                    stack.append(node)
+                    node = node.right
+            if not stack:
+                return
+            node = stack.pop()
+            if lo is not None and node.key < lo:
+                return
+            yield node
+            node = node.left
+
+def irange(node, lo=None, hi=None, reverse=False):
+    """Yield the data of every node with a key in [lo, hi], lazily."""
+    for n in irange_nodes(node, lo, hi, reverse):
+        yield n.data
+
+def entries(node, keyed=False):
+    # Inorder contents in the form load_sorted and setops.merge_sorted take
+    if not keyed:
+        return list(irange(node))
+    return [(n.key, n.data) for n in irange_nodes(node)]
+
+def successor(node, key):
+    """Return the data of the smallest key greater than key, or None."""
+    best = None
+    while node:
+        if key < node.key:
+            best = node.data
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+def predecessor(node, key):
+    """Return the data of the largest key smaller than key, or None."""
+    best = None
+    while node:
+        if key > node.key:
+            best = node.data
+            node = node.right
+        else:
+            node = node.left
+    return best
+
+class RangeQueryMixin:
+    def irange(self, node, lo=None, hi=None, reverse=False):
+        return irange(node, lo, hi, reverse)
+    
+    def successor(self, node, key):
+        return successor(node, key)
+    
+    def predecessor(self, node, key):
+        return predecessor(node, key)
+
+class BulkLoadMixin:
+    def min_value_node(self, node):
+        current = node
+        while current.left:
+            current = current.left
+        return current
+    
+    def load_sorted(self, keys):
+        # keys must already be sorted and free of duplicates; with a key
+        # function they are (key, data) pairs as from setops.sorted_unique
+        return build_balanced(keys, self.node_class, self.key is not None)
+    
+    def bulk_load(self, values):
+        return self.load_sorted(setops.sorted_unique(values, self.key))
+    
+    def build(self, values):
+        values = list(values)
+        if len(values) >= BULK_LOAD_THRESHOLD:
+            return self.bulk_load(values)
+        root = None
+        for val in values:
+            root = self.insert(root, val)
+        return root
+    
+    def copy(self, node):
+        # New nodes in the same shape, so the copy can change independently;
+        # data itself is shared
+        if not node:
+            return None
+        node_class = self.node_class
+        
+        def clone(n):
+            c = node_class(n.data, n.key)
+            c.height = n.height
+            return c
+        
+        root = clone(node)
+        stack = [(node, root)]
+        while stack:
+            n, c = stack.pop()
+            if n.left:
+                c.left = clone(n.left)
+                stack.append((n.left, c.left))
+            if n.right:
+                c.right = clone(n.right)
+                stack.append((n.right, c.right))
+        return root
+
+class BatchUpdateMixin:
+    def estimate_size(self, node, limit=None):
+        # Counts at most limit nodes, so a small batch stays cheap
+        count = 0
+        stack = [node]
+        while stack and count != limit:
+            node = stack.pop()
+            if node:
+                count += 1
+                stack.append(node.left)
+                stack.append(node.right)
+        return count
+    
+    def _prefer_rebuild(self, node, m):
+        # prefer_rebuild never holds once n >= REBUILD_COST * m (that would
+        # take log2(n + m) > 72), so there is no need to count further
+        n = self.estimate_size(node, setops.REBUILD_COST * m)
+        return setops.prefer_rebuild(n, m)
+    
+    def _merge(self, op, node, batch):
+        keyed = self.key is not None
+        return self.load_sorted(setops.merge_sorted(op, entries(node, keyed), batch, keyed))
+    
+    def insert_many(self, node, values):
+        batch = setops.sorted_unique(values, self.key)
+        if not batch:
+            return node
+        if self._prefer_rebuild(node, len(batch)):
+            return self._merge("union", node, batch)
+        # Ascending order would chain a batch that lands in one gap
+        if self.key is None:
+            for val in midpoint_order(batch):
+                node = self._insert(node, val, val)
+        else:
+            for key, val in midpoint_order(batch):
+                node = self._insert(node, val, key)
+        return node
+    
+    def delete_many(self, node, values):
+        batch = setops.sorted_unique(values, self.key)
+        if not batch or not node:
+            return node
+        if self._prefer_rebuild(node, len(batch)):
+            return self._merge("difference", node, batch)
+        for key in (batch if self.key is None else (k for k, _ in batch)):
+            node = self._delete(node, key)
+        return node
+
+class AVLTree(RangeQueryMixin, BulkLoadMixin, BatchUpdateMixin):
+    """AVL tree operating on root nodes passed in and returned by each call.
+
+    ``key`` works like the key argument of sorted(): nodes are ordered by
+    key(data), computed once per node. insert/delete take data; range
+    bounds, successor/predecessor and rank take keys. Without a key
+    function data is compared directly.
+    """
+    node_class = Node
+
+    def __init__(self, key=None):
+        self.key = key
+    
+    def get_height(self, node):
+        if not node:
+            return 0
+        return node.height
+    
+    def get_balance(self, node):
+        if not node:
+            return 0
+        return self.get_height(node.left) - self.get_height(node.right)
+    
+    def right_rotate(self, y):
+        x = y.left
+        T2 = x.right
+        x.right = y
+        y.left = T2
+        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        x.height = 1 + max(self.get_height(x.left), self.get_height(x.right))
+        return x
+    
+    def left_rotate(self, x):
+        y = x.right
+        T2 = y.left
+        y.left = x
+        x.right = T2
+        x.height = 1 + max(self.get_height(x.left), self.get_height(x.right))
+        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        return y
+    
+    def insert(self, node, data):
+        return self._insert(node, data, data if self.key is None else self.key(data))
+    
+    def _insert(self, node, data, key):
+        if not node:
+            return self.node_class(data, key)
+        
+        # Search path walked back up by retrace instead of recursing
+        path = []
+        current = node
+        while current:
+            path.append(current)
+            if key < current.key:
+                current = current.left
+            elif key > current.key:
+                current = current.right
+            else:
+                return node
+        
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = self.node_class(data, key)
+        else:
+            parent.right = self.node_class(data, key)
+        return self.retrace(node, path)
+    
+    def estimate_size(self, node, limit=None):
+        # An AVL tree of height h holds between ~1.6**h and 2**h - 1 keys
+        return 2 ** (node.height - 1) if node else 0
+    
+    def retrace(self, root, path):
+        # Walk back up the search path, rebalancing as needed. Once a
+        # subtree's height is unchanged nothing above it can change either.
+        while path:
+            node = path.pop()
+            old_height = node.height
+            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+            balance = self.get_balance(node)
+            
+            # Left Left / Left Right
+            if balance > 1:
+                if self.get_balance(node.left) < 0:
+                    node.left = self.left_rotate(node.left)
+                subtree = self.right_rotate(node)
+            # Right Right / Right Left
+            elif balance < -1:
+                if self.get_balance(node.right) > 0:
+                    node.right = self.right_rotate(node.right)
+                subtree = self.left_rotate(node)
+            else:
+                subtree = node
+            
+            if subtree is not node:
+                if not path:
+                    root = subtree
+                elif path[-1].left is node:
+                    path[-1].left = subtree
+                else:
+                    path[-1].right = subtree
+            
+            if subtree.height == old_height:
+                break
+        return root
+    
+    def delete(self, node, data):
+        return self._delete(node, data if self.key is None else self.key(data))
+    
+    def _delete(self, node, key):
+        path = []
+        current = node
+        while current:
+            if key < current.key:
+                path.append(current)
+                current = current.left
+            elif key > current.key:
+                path.append(current)
+                current = current.right
+            else:
+                break
+        if not current:
+            return node
+        
+        if current.left and current.right:
+            path.append(current)
+            temp = current.right
+            while temp.left:
+                path.append(temp)
+                temp = temp.left
+            current.data = temp.data
+            current.key = temp.key
+            current = temp
+        
+        child = current.left or current.right
+        if not path:
+            return child
+        if path[-1].left is current:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        return self.retrace(node, path)
+    
+    def set_operation(self, op, a, b, workers=None):
+        # a and b are consumed: their nodes are reused for the result
+        if workers and workers > 1:
+            keyed = self.key is not None
+            return self.load_sorted(setops.parallel_set_operation(
+                op, entries(a, keyed), entries(b, keyed), workers, keyed))
+        return getattr(setops, op)(a, b)
+    
+    def union(self, a, b, workers=None):
+        return self.set_operation("union", a, b, workers)
+    
+    def intersection(self, a, b, workers=None):
+        return self.set_operation("intersection", a, b, workers)
+    
+    def difference(self, a, b, workers=None):
+        return self.set_operation("difference", a, b, workers)
+
+class BinarySearchTree(RangeQueryMixin, BulkLoadMixin, BatchUpdateMixin):
+    """Unbalanced search tree; ``key`` works as for AVLTree."""
+    node_class = Node
+
+    def __init__(self, key=None):
+        self.key = key
+    
+    def insert(self, node, data):
+        return self._insert(node, data, data if self.key is None else self.key(data))
+    
+    def _insert(self, node, data, key):
+        if not node:
+            return self.node_class(data, key)
+        
+        current = node
+        while True:
+            if key < current.key:
+                if not current.left:
+                    current.left = self.node_class(data, key)
+                    break
+                current = current.left
+            elif key > current.key:
+                if not current.right:
+                    current.right = self.node_class(data, key)
+                    break
+                current = current.right
+            else:
+                break
+        
+        return node
+    
+    def delete(self, node, data):
+        return self._delete(node, data if self.key is None else self.key(data))
+    
+    def _delete(self, node, key):
+        parent = None
+        current = node
+        while current and current.key != key:
+            parent = current
+            current = current.left if key < current.key else current.right
+        if not current:
+            return node
+        
+        if current.left and current.right:
+            parent = current
+            temp = current.right
+            while temp.left:
+                parent = temp
+                temp = temp.left
+            current.data = temp.data
+            current.key = temp.key
+            current = temp
+        
+        child = current.left or current.right
+        if not parent:
+            return child
+        if parent.left is current:
+            parent.left = child
+        else:
+            parent.right = child
+        return node
+
+class SizedNode(Node):
+    __slots__ = ("size",)
+
+    def __init__(self, data, key=None):
+        super().__init__(data, key)
+        self.size = 1
+
+class OrderStatisticMixin:
+    """Keeps ``size`` on every node so rank/select run in O(log n).
+
+    Sizes along the search path are adjusted before the base class changes
+    the structure; rotations then only have to fix the two nodes they move.
+    """
+    node_class = SizedNode
+
+    def _search_path(self, node, key):
+        path = []
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        return path, node
+    
+    def _insert(self, node, data, key):
+        path, found = self._search_path(node, key)
+        if not found:
+            for n in path:
+                n.size += 1
+        return super()._insert(node, data, key)
+    
+    def _delete(self, node, key):
+        path, found = self._search_path(node, key)
+        if found:
+            for n in path:
+                n.size -= 1
+            found.size -= 1
+            # The successor is unlinked from the right subtree instead
+            if found.left and found.right:
+                n = found.right
+                while n:
+                    n.size -= 1
+                    n = n.left
+        return super()._delete(node, key)
+    
+    def right_rotate(self, y):
+        x = super().right_rotate(y)
+        y.size = 1 + order_stats.subtree_size(y.left) + order_stats.subtree_size(y.right)
+        x.size = 1 + order_stats.subtree_size(x.left) + y.size
+        return x
+    
+    def left_rotate(self, x):
+        y = super().left_rotate(x)
+        x.size = 1 + order_stats.subtree_size(x.left) + order_stats.subtree_size(x.right)
+        y.size = 1 + x.size + order_stats.subtree_size(y.right)
+        return y
+    
+    def load_sorted(self, keys):
+        root = super().load_sorted(keys)
+        order_stats.fill_sizes(root)
+        return root
+    
+    def copy(self, node):
+        root = super().copy(node)
+        order_stats.fill_sizes(root)
+        return root
+    
+    def estimate_size(self, node, limit=None):
+        return order_stats.subtree_size(node)
+    
+    def set_operation(self, op, a, b, workers=None):
+        # join/split don't track sizes, so recount once at the end
+        root = super().set_operation(op, a, b, workers)
+        order_stats.fill_sizes(root)
+        return root
+    
+    def select(self, node, k):
+        return order_stats.select(node, k)
+    
+    def rank(self, node, key):
+        return order_stats.rank(node, key)
+    
+    def count_range(self, node, lo, hi):
+        return order_stats.count_range(node, lo, hi)
+
+class OrderStatisticAVLTree(OrderStatisticMixin, AVLTree):
+    pass
+
+class OrderStatisticBST(OrderStatisticMixin, BinarySearchTree):
+    pass
@@ -0,0 +1,128 @@
+"""Level-order to traversal conversion on NumPy arrays, without TreeNode objects.
+
+Present (non-'null') tokens are numbered in level order.  The k-th present
+node always owns tokens ``2k + 1`` and ``2k + 2`` as its children, so the
+child links fall out of a cumulative sum over the null mask.  Nodes of one
+level form a contiguous rank range, which lets subtree sizes and traversal
+positions be filled in one vectorized step per level.
+
+That is one Python-level step per level, so the engine only pays off on
+bushy trees. Input deeper than about n / 64 levels (chains, skewed trees)
+is handed to the object engine instead, which is faster there.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The vectorized engine requires NumPy (pip install numpy)")
+
+# Trees deeper than max(MIN_DEPTH_LIMIT, n // DEPTH_RATIO) levels fall back
+# to the object engine
+DEPTH_RATIO = 64
+MIN_DEPTH_LIMIT = 32
+
+def null_mask(values):
+    values = values if isinstance(values, list) else list(values)
+    mask = np.fromiter((v.lower() != 'null' for v in values), dtype=bool, count=len(values))
+    return values, mask
+
+def child_arrays(mask, max_levels=None):
+    """Return (positions, left, right, levels) for a level-order null mask.
+
+    ``positions[k]`` is the token index of the k-th present node, ``left``
+    and ``right`` hold child ranks with ``n`` meaning "no child", and
+    ``levels`` lists the rank boundaries of each level. Returns None if
+    the tree has more than ``max_levels`` levels.
+    """
+    _require_numpy()
+    m = len(mask)
+    if m == 0 or not mask[0]:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty, [0]
+
+    # Parsing stops once every present node has taken its two children
+    # (the BFS queue runs dry); anything after that point is ignored.
+    present_before = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)[:-1]))
+    owner = (np.arange(m, dtype=np.int64) - 1) // 2
+    dry = np.flatnonzero(owner[1:] >= present_before[1:])
+    if len(dry):
+        m = int(dry[0]) + 1
+        mask = mask[:m]
+
+    positions = np.flatnonzero(mask)
+    n = len(positions)
+    rank = np.cumsum(mask, dtype=np.int64) - 1
+
+    left = np.full(n, n, dtype=np.int64)
+    right = np.full(n, n, dtype=np.int64)
+    slots = 2 * np.arange(n, dtype=np.int64) + 1
+    for side, pos in ((left, slots), (right, slots + 1)):
+        ok = pos < m
+        idx = np.flatnonzero(ok)
+        has = mask[pos[ok]]
+        side[idx[has]] = rank[pos[ok][has]]
+
+    levels = [0, 1]
+    while levels[-1] < n:
+        if max_levels is not None and len(levels) > max_levels:
+            return None
+        lo, hi = levels[-2], levels[-1]
+        count = int(np.count_nonzero(left[lo:hi] < n) + np.count_nonzero(right[lo:hi] < n))
+        levels.append(hi + count)
+    return positions, left, right, levels
+
+def traversal_permutation(mask, order, max_levels=None):
+    """Return token indices of ``mask``'s tree in Inorder/Preorder/Postorder,
+    or None if it is deeper than ``max_levels``."""
+    if order not in ("Inorder", "Preorder", "Postorder"):
+        raise ValueError(f"Unknown traversal: {order}")
+    arrays = child_arrays(mask, max_levels)
+    if arrays is None:
+        return None
+    positions, left, right, levels = arrays
+    n = len(positions)
+    if n == 0:
+        return positions
+
+    # size[n] is the "no child" sentinel
+    size = np.zeros(n + 1, dtype=np.int64)
+    for lo, hi in zip(reversed(levels[:-1]), reversed(levels[1:])):
+        size[lo:hi] = 1 + size[left[lo:hi]] + size[right[lo:hi]]
+
+    # start[k] is the first output slot used by k's subtree
+    start = np.zeros(n + 1, dtype=np.int64)
+    slot = np.empty(n, dtype=np.int64)
+    for lo, hi in zip(levels[:-1], levels[1:]):
+        s = start[lo:hi]
+        lsize = size[left[lo:hi]]
+        if order == "Preorder":
+            slot[lo:hi] = s
+            start[left[lo:hi]] = s + 1
+            start[right[lo:hi]] = s + 1 + lsize
+        elif order == "Inorder":
+            slot[lo:hi] = s + lsize
+            start[left[lo:hi]] = s
+            start[right[lo:hi]] = s + lsize + 1
+        else:
+            slot[lo:hi] = s + size[lo:hi] - 1
+            start[left[lo:hi]] = s
+            start[right[lo:hi]] = s + lsize
+
+    perm = np.empty(n, dtype=np.int64)
+    perm[slot] = positions
+    return perm
+
+def traverse_level_order(values, order):
+    _require_numpy()
+    values, mask = null_mask(values)
+    max_levels = max(MIN_DEPTH_LIMIT, int(np.count_nonzero(mask)) // DEPTH_RATIO)
+    perm = traversal_permutation(mask, order, max_levels)
+    if perm is None:
+        from treeconverter.converter import convert_level_order
+        yield from convert_level_order(values, order)
+        return
+    for i in perm.tolist():
+        yield values[i]